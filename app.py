@@ -1,8 +1,148 @@
+from collections import OrderedDict
+from datetime import date
+from itertools import accumulate
+
+import pandas as pd
 import streamlit as st
-from pawpal_system import Owner, Pet, CareTask, Scheduler
+from pawpal_system import Owner, Pet, CareTask, Schedule, Scheduler
 
 st.set_page_config(page_title="PawPal+", page_icon="🐾", layout="centered")
 
+
+# ===== Widget option constants =====
+# Tuples are compile-time constants, so reruns don't rebuild these option lists
+
+_SPECIES = ("dog", "cat", "rabbit", "bird", "other")
+_PRIORITIES = ("low", "medium", "high")
+_FREQUENCIES = ("once", "daily", "biweekly", "weekly", "monthly", "quarterly", "yearly")
+_PET_SCOPES = ("Selected Pet Only", "All Pets")
+_STATUS_FILTERS = ("All Status", "Pending Only", "Completed Only")
+_VIEW_MODES = ("All", "Time", "Priority")
+
+
+# ===== Display lookup tables =====
+# Built once at import instead of as dict literals inside per-task loops
+
+_FREQ_DISPLAY = {
+    "once": "🔵 Once",
+    "daily": "🔄 Daily",
+    "biweekly": "📅 Biweekly",
+    "weekly": "📆 Weekly",
+    "monthly": "🗓️ Monthly",
+    "quarterly": "📊 Quarterly",
+    "yearly": "🎂 Yearly"
+}
+
+_PRIORITY_EMOJI = {
+    "high": "🔴",
+    "medium": "🟡",
+    "low": "🟢"
+}
+
+_FREQ_BADGE = {
+    "once": "",
+    "daily": "🔄",
+    "biweekly": "📅",
+    "weekly": "📆",
+    "monthly": "🗓️",
+    "quarterly": "📊",
+    "yearly": "🎂"
+}
+
+
+# ===== Cached views =====
+# st.cache_data is shared by every session in the process, so each view is bounded
+
+VIEW_CACHE_ENTRIES = 64  # Max distinct task lists remembered per cached view
+
+
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_ENTRIES)
+def sorted_view(view_mode: str, fingerprint: tuple) -> list[int]:
+    """Return the display order for a task list as a permutation of indices.
+
+    Args:
+        view_mode: "Time" (chronological) or "Priority" (high > medium > low)
+        fingerprint: Tuple of (task_id, priority, time_minutes) per task
+
+    Caches plain ints rather than CareTask objects so Streamlit can hash
+    and store the result cheaply; callers re-index their own task list.
+    """
+    indices = range(len(fingerprint))
+    if view_mode == "Time":
+        # Same ordering as Scheduler.sort_by_time (untimed tasks last)
+        return sorted(indices, key=lambda i: fingerprint[i][2])
+    if view_mode == "Priority":
+        # Sort by priority (high > medium > low)
+        priority_order = {"high": 3, "medium": 2, "low": 1}
+        return sorted(indices, key=lambda i: priority_order.get(fingerprint[i][1], 0), reverse=True)
+    return list(indices)
+
+
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_ENTRIES)
+def build_task_df(fingerprint: tuple) -> pd.DataFrame:
+    """Build the task list table as a typed DataFrame.
+
+    Args:
+        fingerprint: Tuple of (pet_name, preferred_time, name, duration,
+            priority, frequency, completed) per displayed task, in order
+
+    Cached so no-op reruns reuse the same frame instead of re-inferring
+    the schema from a fresh list of dicts.
+    """
+    task_data = [
+        {
+            "#": i,
+            "Pet": pet_name or "—",
+            "Time": preferred_time or "—",
+            "Task": name,
+            "Duration": f"{duration} min",
+            "Priority": priority.capitalize(),
+            "Recurrence": _FREQ_DISPLAY.get(frequency, frequency),
+            "Status": "✅ Done" if completed else "⏳ Pending"
+        }
+        for i, (pet_name, preferred_time, name, duration, priority, frequency, completed)
+        in enumerate(fingerprint, 1)
+    ]
+    columns = ["#", "Pet", "Time", "Task", "Duration", "Priority", "Recurrence", "Status"]
+    return pd.DataFrame.from_records(task_data, columns=columns).astype({
+        "Pet": "string",
+        "Time": "string",
+        "Task": "string",
+        "Duration": "string",
+        "Priority": "category",
+        "Recurrence": "category",
+        "Status": "category"
+    })
+
+
+SCHEDULE_CACHE_SIZE = 32  # Max generated schedules remembered per session
+
+
+def get_schedule(owner: Owner, pet: Pet, tasks: list, avoid_overlaps: bool = False) -> Schedule:
+    """Return a schedule for the given inputs, reusing a previous result if unchanged.
+
+    Schedules are memoized in st.session_state.schedule_cache (a small LRU)
+    keyed on the owner's constraints, the pet, and each task's scheduling fields.
+    """
+    cache = st.session_state.schedule_cache
+    fingerprint = (
+        owner.name,
+        owner.time_available,
+        pet.name,
+        avoid_overlaps,
+        tuple(sorted((t.task_id, t.duration, t.priority, t.time_minutes) for t in tasks))
+    )
+    schedule = cache.get(fingerprint)
+    if schedule is None:
+        schedule = Scheduler(owner=owner, pet=pet, tasks=tasks, avoid_overlaps=avoid_overlaps).generate_schedule()
+        cache[fingerprint] = schedule
+        if len(cache) > SCHEDULE_CACHE_SIZE:
+            cache.popitem(last=False)  # Evict least recently used
+    else:
+        cache.move_to_end(fingerprint)
+    return schedule
+
+
 # ===== Initialize session state (the "vault") =====
 # Check if objects exist, create them if not
 
@@ -21,6 +161,16 @@ if "tasks" not in st.session_state:
 if "schedules" not in st.session_state:
     st.session_state.schedules = {}  # Dict mapping pet_name -> Schedule
 
+if "schedule_cache" not in st.session_state:
+    st.session_state.schedule_cache = OrderedDict()  # LRU mapping input fingerprint -> Schedule
+
+# Indexes kept in sync with pets/tasks so lookups by pet name are O(1)
+if "pets_by_name" not in st.session_state:
+    st.session_state.pets_by_name = {}  # Dict mapping pet_name -> Pet
+
+if "tasks_by_pet" not in st.session_state:
+    st.session_state.tasks_by_pet = {}  # Dict mapping pet_name -> list of CareTask
+
 # ===== App Header =====
 st.title("🐾 PawPal+")
 st.markdown("**AI-powered pet care planning assistant**")
@@ -31,21 +181,30 @@ st.divider()
 # ===== Owner Information Section =====
 st.subheader("👤 Owner Information")
 
-col1, col2 = st.columns(2)
-with col1:
-    owner_name = st.text_input("Owner name", value="Jordan", key="owner_name_input")
-with col2:
-    time_available = st.number_input(
-        "Time available today (minutes)",
-        min_value=0,
-        max_value=1440,  # 24 hours
-        value=480,  # 8 hours default
-        step=30,
-        help="How much time do you have for pet care today?"
-    )
+# Owner inputs live in a form so edits are batched into a single rerun on save
+with st.form("owner_form"):
+    col1, col2 = st.columns(2)
+    with col1:
+        owner_name = st.text_input("Owner name", value="Jordan", key="owner_name_input")
+    with col2:
+        time_available = st.number_input(
+            "Time available today (minutes)",
+            min_value=0,
+            max_value=1440,  # 24 hours
+            value=480,  # 8 hours default
+            step=30,
+            help="How much time do you have for pet care today?",
+            key="time_available_input"
+        )
+    owner_submitted = st.form_submit_button("💾 Save Owner")
 
-# Create/update Owner object in session state
-st.session_state.owner = Owner(name=owner_name, time_available=time_available)
+# Create/update Owner object in session state (first run, or on save with changed inputs)
+current_owner = st.session_state.owner
+if current_owner is None or (
+    owner_submitted
+    and (current_owner.name != owner_name or current_owner.time_available != time_available)
+):
+    st.session_state.owner = Owner(name=owner_name, time_available=int(time_available))
 
 st.divider()
 
@@ -74,34 +233,39 @@ st.markdown("---")
 st.markdown("**Add a new pet:**")
 
 # Add new pet form
-col1, col2, col3 = st.columns([2, 2, 1])
-with col1:
-    new_pet_name = st.text_input("Pet name", placeholder="e.g., Mochi", key="new_pet_name_input")
-with col2:
-    new_species = st.selectbox("Species", ["dog", "cat", "rabbit", "bird", "other"], key="new_species_select")
-with col3:
-    st.markdown("<div style='height: 28px'></div>", unsafe_allow_html=True)  # Spacer
-    if st.button("➕ Add Pet", use_container_width=True):
-        if new_pet_name:
-            # Check if pet name already exists
-            if any(p.name == new_pet_name for p in st.session_state.pets):
-                st.error(f"❌ Pet named '{new_pet_name}' already exists!")
-            else:
-                # Create new pet
-                new_pet = Pet(name=new_pet_name, type=new_species)
-                st.session_state.pets.append(new_pet)
-                st.session_state.selected_pet = new_pet_name  # Auto-select new pet
-                st.success(f"✅ Added {new_pet_name}!")
-                st.rerun()
+with st.form("add_pet_form", clear_on_submit=True):
+    col1, col2 = st.columns(2)
+    with col1:
+        new_pet_name = st.text_input("Pet name", placeholder="e.g., Mochi", key="new_pet_name_input")
+    with col2:
+        new_species = st.selectbox("Species", _SPECIES, key="new_species_select")
+    pet_submitted = st.form_submit_button("➕ Add Pet", use_container_width=True)
+
+if pet_submitted:
+    if new_pet_name:
+        # Check if pet name already exists
+        if new_pet_name in st.session_state.pets_by_name:
+            st.error(f"❌ Pet named '{new_pet_name}' already exists!")
         else:
-            st.warning("⚠️ Please enter a pet name.")
+            # Create new pet
+            new_pet = Pet(name=new_pet_name, type=new_species)
+            st.session_state.pets.append(new_pet)
+            st.session_state.pets_by_name[new_pet_name] = new_pet
+            st.session_state.selected_pet = new_pet_name  # Auto-select new pet
+            st.success(f"✅ Added {new_pet_name}!")
+            st.rerun()
+    else:
+        st.warning("⚠️ Please enter a pet name.")
 
 # Option to remove selected pet
 if st.session_state.selected_pet and st.session_state.pets:
     if st.button("🗑️ Remove Selected Pet", type="secondary"):
-        # Remove pet and its tasks
-        st.session_state.pets = [p for p in st.session_state.pets if p.name != st.session_state.selected_pet]
-        st.session_state.tasks = [t for t in st.session_state.tasks if t.pet_name != st.session_state.selected_pet]
+        # Remove pet and its tasks in place (slice assignment reuses the existing lists)
+        st.session_state.pets[:] = [p for p in st.session_state.pets if p.name != st.session_state.selected_pet]
+        if st.session_state.selected_pet in st.session_state.tasks_by_pet:
+            st.session_state.tasks[:] = [t for t in st.session_state.tasks if t.pet_name != st.session_state.selected_pet]
+        st.session_state.pets_by_name.pop(st.session_state.selected_pet, None)
+        st.session_state.tasks_by_pet.pop(st.session_state.selected_pet, None)
         if st.session_state.selected_pet in st.session_state.schedules:
             del st.session_state.schedules[st.session_state.selected_pet]
         st.session_state.selected_pet = None
@@ -117,34 +281,41 @@ if st.session_state.selected_pet:
 else:
     st.warning("⚠️ Please select a pet first to add tasks.")
 
-# Task input fields
-col1, col2, col3 = st.columns(3)
-with col1:
-    task_title = st.text_input("Task name", value="Morning walk", key="task_title_input")
-with col2:
-    duration = st.number_input("Duration (minutes)", min_value=1, max_value=240, value=30)
-with col3:
-    priority = st.selectbox("Priority", ["low", "medium", "high"], index=2)
-
-# Advanced options in expander
-with st.expander("⏰ Advanced Options (Time & Recurrence)"):
-    col1, col2 = st.columns(2)
+# Task input fields (batched in a form so only "Add Task" triggers a rerun)
+with st.form("add_task_form"):
+    col1, col2, col3 = st.columns(3)
     with col1:
-        preferred_time = st.text_input(
-            "Preferred time",
-            value="",
-            placeholder="e.g., 8:00 AM or 14:30",
-            help="Optional: 24-hour (14:30) or 12-hour (2:30 PM) format"
-        )
+        task_title = st.text_input("Task name", value="Morning walk", key="task_title_input")
     with col2:
-        frequency = st.selectbox(
-            "Recurrence",
-            ["once", "daily", "biweekly", "weekly", "monthly", "quarterly", "yearly"],
-            help="How often should this task repeat?"
-        )
+        duration = st.number_input("Duration (minutes)", min_value=1, max_value=240, value=30, key="task_duration_input")
+    with col3:
+        priority = st.selectbox("Priority", _PRIORITIES, index=2, key="task_priority_select")
+
+    # Advanced options in expander
+    with st.expander("⏰ Advanced Options (Time & Recurrence)"):
+        col1, col2 = st.columns(2)
+        with col1:
+            preferred_time = st.text_input(
+                "Preferred time",
+                value="",
+                placeholder="e.g., 8:00 AM or 14:30",
+                help="Optional: 24-hour (14:30) or 12-hour (2:30 PM) format",
+                key="task_time_input"
+            )
+        with col2:
+            frequency = st.selectbox(
+                "Recurrence",
+                _FREQUENCIES,
+                help="How often should this task repeat?",
+                key="task_frequency_select"
+            )
+
+    # Add Task button - creates actual CareTask objects
+    task_submitted = st.form_submit_button(
+        "➕ Add Task", use_container_width=True, disabled=not st.session_state.selected_pet
+    )
 
-# Add Task button - creates actual CareTask objects
-if st.button("➕ Add Task", use_container_width=True, disabled=not st.session_state.selected_pet):
+if task_submitted:
     if not st.session_state.selected_pet:
         st.error("❌ Please select a pet first!")
     else:
@@ -161,145 +332,138 @@ if st.button("➕ Add Task", use_container_width=True, disabled=not st.session_s
             )
             # Add to session state
             st.session_state.tasks.append(new_task)
+            st.session_state.tasks_by_pet.setdefault(new_task.pet_name, []).append(new_task)
             st.success(f"✅ Added: {new_task.name} for {st.session_state.selected_pet} ({frequency})")
             st.rerun()  # Force refresh to show new task immediately
         except ValueError as e:
             st.error(f"❌ Error adding task: {e}")
 
 # Display current tasks
-if st.session_state.tasks:
-    # Filter options
-    col1, col2, col3 = st.columns([2, 2, 1])
-    with col1:
-        filter_option = st.radio(
-            "Show tasks for:",
-            ["Selected Pet Only", "All Pets"],
-            horizontal=True,
-            label_visibility="collapsed"
-        )
-    with col2:
-        completion_filter = st.radio(
-            "Status:",
-            ["All Status", "Pending Only", "Completed Only"],
-            horizontal=True,
-            label_visibility="collapsed"
-        )
-    with col3:
-        # View mode selector
-        view_mode = st.selectbox(
-            "Sort:",
-            ["All", "Time", "Priority"],
-            label_visibility="collapsed"
-        )
+# Runs as a fragment so flipping the filter/sort widgets only re-executes
+# this section instead of the whole script
+@st.fragment
+def render_task_list() -> None:
+    """Render the filterable task table and completion controls."""
+    if st.session_state.tasks:
+        # Filter options
+        col1, col2, col3 = st.columns([2, 2, 1])
+        with col1:
+            filter_option = st.radio(
+                "Show tasks for:",
+                _PET_SCOPES,
+                horizontal=True,
+                label_visibility="collapsed"
+            )
+        with col2:
+            completion_filter = st.radio(
+                "Status:",
+                _STATUS_FILTERS,
+                horizontal=True,
+                label_visibility="collapsed"
+            )
+        with col3:
+            # View mode selector
+            view_mode = st.selectbox(
+                "Sort:",
+                _VIEW_MODES,
+                label_visibility="collapsed"
+            )
 
-    # Filter tasks based on selected pet
-    if filter_option == "Selected Pet Only" and st.session_state.selected_pet:
-        display_tasks = [t for t in st.session_state.tasks if t.pet_name == st.session_state.selected_pet]
-    else:
-        display_tasks = st.session_state.tasks.copy()
-
-    # Filter by completion status
-    if completion_filter == "Pending Only":
-        display_tasks = [t for t in display_tasks if not t.completed]
-    elif completion_filter == "Completed Only":
-        display_tasks = [t for t in display_tasks if t.completed]
-
-    st.markdown(f"**Showing {len(display_tasks)} task(s):**")
-
-    # Sort tasks based on view mode
-    if view_mode == "Time" and display_tasks:
-        # Use backend sorting logic
-        from pawpal_system import Scheduler
-        # Create temporary pet object for scheduler if needed
-        temp_pet = next((p for p in st.session_state.pets if p.name == st.session_state.selected_pet),
-                       Pet(name="temp", type="dog")) if st.session_state.selected_pet else Pet(name="temp", type="dog")
-        temp_scheduler = Scheduler(
-            owner=st.session_state.owner,
-            pet=temp_pet,
-            tasks=display_tasks
-        )
-        display_tasks = temp_scheduler.sort_by_time()
-    elif view_mode == "Priority":
-        # Sort by priority (high > medium > low)
-        priority_order = {"high": 3, "medium": 2, "low": 1}
-        display_tasks = sorted(
-            display_tasks,
-            key=lambda t: priority_order.get(t.priority, 0),
-            reverse=True
+        # Filter tasks based on selected pet
+        if filter_option == "Selected Pet Only" and st.session_state.selected_pet:
+            display_tasks = list(st.session_state.tasks_by_pet.get(st.session_state.selected_pet, []))
+        else:
+            display_tasks = st.session_state.tasks.copy()
+
+        # Filter by completion status
+        if completion_filter == "Pending Only":
+            display_tasks = [t for t in display_tasks if not t.completed]
+        elif completion_filter == "Completed Only":
+            display_tasks = [t for t in display_tasks if t.completed]
+
+        st.markdown(f"**Showing {len(display_tasks)} task(s):**")
+
+        # Sort tasks based on view mode
+        if view_mode in ("Time", "Priority") and display_tasks:
+            fingerprint = tuple((t.task_id, t.priority, t.time_minutes) for t in display_tasks)
+            display_tasks = [display_tasks[i] for i in sorted_view(view_mode, fingerprint)]
+
+        # Create enhanced table display (cached DataFrame keyed on displayed fields)
+        fingerprint = tuple(
+            (t.pet_name, t.preferred_time, t.name, t.duration, t.priority, t.frequency, t.completed)
+            for t in display_tasks
         )
+        st.dataframe(build_task_df(fingerprint), use_container_width=True, hide_index=True)
+
+        # Task completion section
+        st.markdown("**Mark tasks as complete:**")
+
+        # Show pending tasks in one editable table; ticked rows are completed in a single batch
+        pending_tasks = [t for t in display_tasks if not t.completed]
+        if pending_tasks:
+            pending_by_id = {t.task_id: t for t in pending_tasks}
+            pending_df = pd.DataFrame(
+                {
+                    "Done": [False] * len(pending_tasks),
+                    "Task": [t.name for t in pending_tasks],
+                    "Pet": [t.pet_name or "—" for t in pending_tasks],
+                    "Time": [t.preferred_time or "—" for t in pending_tasks]
+                },
+                index=[t.task_id for t in pending_tasks]
+            )
 
-    # Create enhanced table display with completion checkboxes
-    task_data = []
-    for i, task in enumerate(display_tasks, 1):
-        # Format time
-        time_str = task.preferred_time if task.preferred_time else "—"
-
-        # Format frequency with emoji
-        freq_display = {
-            "once": "🔵 Once",
-            "daily": "🔄 Daily",
-            "biweekly": "📅 Biweekly",
-            "weekly": "📆 Weekly",
-            "monthly": "🗓️ Monthly",
-            "quarterly": "📊 Quarterly",
-            "yearly": "🎂 Yearly"
-        }.get(task.frequency, task.frequency)
-
-        # Completion status
-        status_icon = "✅ Done" if task.completed else "⏳ Pending"
-
-        task_data.append({
-            "#": i,
-            "Pet": task.pet_name if task.pet_name else "—",
-            "Time": time_str,
-            "Task": task.name,
-            "Duration": f"{task.duration} min",
-            "Priority": task.priority.capitalize(),
-            "Recurrence": freq_display,
-            "Status": status_icon
-        })
-
-    st.dataframe(task_data, use_container_width=True, hide_index=True)
-
-    # Task completion section
-    st.markdown("**Mark tasks as complete:**")
-
-    # Show pending tasks with completion buttons
-    pending_tasks = [t for t in display_tasks if not t.completed]
-    if pending_tasks:
-        cols = st.columns(min(len(pending_tasks), 3))
-        for idx, task in enumerate(pending_tasks):
-            with cols[idx % 3]:
-                if st.button(f"✓ {task.name[:20]}", key=f"complete_{task.task_id}", use_container_width=True):
-                    # Mark task as complete
-                    next_task = task.mark_complete()
-
-                    # If recurring, add the next occurrence
-                    if next_task:
-                        st.session_state.tasks.append(next_task)
-                        st.success(f"✅ {task.name} completed! Next occurrence: {next_task.due_date}")
-                    else:
-                        st.success(f"✅ {task.name} marked as complete!")
+            with st.form("complete_tasks_form"):
+                edited = st.data_editor(
+                    pending_df,
+                    column_config={"Done": st.column_config.CheckboxColumn("Done")},
+                    disabled=["Task", "Pet", "Time"],
+                    hide_index=True,
+                    use_container_width=True
+                )
+                complete_submitted = st.form_submit_button("✓ Mark Selected Complete", use_container_width=True)
+
+            if complete_submitted:
+                done_ids = edited.index[edited["Done"]]
+                if len(done_ids) == 0:
+                    st.warning("⚠️ Tick at least one task to mark it complete.")
+                else:
+                    # Mark tasks complete and collect any recurring successors
+                    today = date.today()  # Read the clock once for the whole batch
+                    next_tasks = []
+                    for task_id in done_ids:
+                        next_task = pending_by_id[task_id].mark_complete(today)
+                        if next_task:
+                            next_tasks.append(next_task)
+
+                    # Add next occurrences of recurring tasks in one batch
+                    st.session_state.tasks.extend(next_tasks)
+                    for next_task in next_tasks:
+                        st.session_state.tasks_by_pet.setdefault(next_task.pet_name, []).append(next_task)
 
                     st.rerun()
+        else:
+            st.info("🎉 All tasks completed!")
+
+        # Button to clear all tasks
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("🗑️ Clear All Tasks", use_container_width=True):
+                st.session_state.tasks = []
+                st.session_state.tasks_by_pet = {}
+                st.session_state.schedules = {}
+                st.session_state.schedule_cache.clear()
+                st.rerun()
+        with col2:
+            if st.button("🔄 Reset Completed", use_container_width=True):
+                for task in st.session_state.tasks:
+                    task.completed = False
+                st.success("✅ All tasks reset to pending!")
+                st.rerun()
     else:
-        st.info("🎉 All tasks completed!")
+        st.info("📝 No tasks yet. Add one above to get started!")
 
-    # Button to clear all tasks
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("🗑️ Clear All Tasks", use_container_width=True):
-            st.session_state.tasks = []
-            st.session_state.schedules = {}
-            st.rerun()
-    with col2:
-        if st.button("🔄 Reset Completed", use_container_width=True):
-            for task in st.session_state.tasks:
-                task.completed = False
-            st.success("✅ All tasks reset to pending!")
-            st.rerun()
-else:
-    st.info("📝 No tasks yet. Add one above to get started!")
+
+render_task_list()
 
 st.divider()
 
@@ -312,12 +476,16 @@ col1, col2 = st.columns([2, 1])
 with col1:
     schedule_mode = st.radio(
         "Generate schedule for:",
-        ["Selected Pet Only", "All Pets"],
+        _PET_SCOPES,
         horizontal=True,
         help="Generate schedules for one pet or all your pets"
     )
 with col2:
-    pass  # Reserved for future options
+    avoid_overlaps = st.checkbox(
+        "Avoid overlaps",
+        value=False,
+        help="Skip timed tasks that would overlap instead of scheduling them and warning about conflicts"
+    )
 
 # Display current constraints
 st.markdown("**Current Settings:**")
@@ -325,11 +493,11 @@ col1, col2, col3 = st.columns(3)
 with col1:
     st.metric("Owner", st.session_state.owner.name if st.session_state.owner else "N/A")
 with col2:
-    st.metric("Available Time", f"{time_available} min")
+    st.metric("Available Time", f"{st.session_state.owner.time_available} min")
 with col3:
     if schedule_mode == "Selected Pet Only":
         if st.session_state.selected_pet:
-            pet_tasks = [t for t in st.session_state.tasks if t.pet_name == st.session_state.selected_pet]
+            pet_tasks = st.session_state.tasks_by_pet.get(st.session_state.selected_pet, [])
             st.metric(f"Tasks for {st.session_state.selected_pet}", len(pet_tasks))
         else:
             st.metric("Tasks", "No pet selected")
@@ -353,32 +521,24 @@ if st.button("🚀 Generate Schedule", type="primary", use_container_width=True)
 
             if schedule_mode == "Selected Pet Only":
                 # Generate schedule for selected pet only
-                selected_pet_obj = next((p for p in st.session_state.pets if p.name == st.session_state.selected_pet), None)
+                selected_pet_obj = st.session_state.pets_by_name.get(st.session_state.selected_pet)
                 if selected_pet_obj:
-                    pet_tasks = [t for t in st.session_state.tasks if t.pet_name == st.session_state.selected_pet]
+                    pet_tasks = st.session_state.tasks_by_pet.get(st.session_state.selected_pet, [])
 
-                    scheduler = Scheduler(
-                        owner=st.session_state.owner,
-                        pet=selected_pet_obj,
-                        tasks=pet_tasks
+                    st.session_state.schedules[st.session_state.selected_pet] = get_schedule(
+                        st.session_state.owner, selected_pet_obj, pet_tasks, avoid_overlaps
                     )
-
-                    st.session_state.schedules[st.session_state.selected_pet] = scheduler.generate_schedule()
                     st.success(f"✅ Schedule generated for {st.session_state.selected_pet}!")
             else:
                 # Generate schedules for all pets
                 for pet in st.session_state.pets:
-                    pet_tasks = [t for t in st.session_state.tasks if t.pet_name == pet.name]
+                    pet_tasks = st.session_state.tasks_by_pet.get(pet.name, [])
 
                     if pet_tasks:  # Only generate if pet has tasks
-                        scheduler = Scheduler(
-                            owner=st.session_state.owner,
-                            pet=pet,
-                            tasks=pet_tasks
+                        st.session_state.schedules[pet.name] = get_schedule(
+                            st.session_state.owner, pet, pet_tasks, avoid_overlaps
                         )
 
-                        st.session_state.schedules[pet.name] = scheduler.generate_schedule()
-
                 if st.session_state.schedules:
                     st.success(f"✅ Schedules generated for {len(st.session_state.schedules)} pet(s)!")
                     st.balloons()
@@ -394,113 +554,79 @@ st.divider()
 if st.session_state.schedules:
     st.subheader("📊 Your Daily Schedule(s)")
 
-    # Display schedule for each pet
+    # Collect every pet's scheduled tasks into one table (single dataframe render)
+    task_table = []
     for pet_name, schedule in st.session_state.schedules.items():
-        st.markdown(f"### 🐾 {pet_name}'s Schedule")
-
-
-
-        # Display summary metrics for this pet
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            pet_task_count = len([t for t in st.session_state.tasks if t.pet_name == pet_name])
-            st.metric(
-                "Tasks Scheduled",
-                len(schedule.scheduled_tasks),
-                delta=f"{len(schedule.scheduled_tasks)} / {pet_task_count}"
-            )
-        with col2:
-            st.metric(
-                "Total Time",
-                f"{schedule.total_duration} min",
-                delta=f"{schedule.total_duration - schedule.owner.time_available} min" if not schedule.is_feasible() else None,
-                delta_color="inverse"
-            )
-        with col3:
-            feasible = schedule.is_feasible()
-            st.metric(
-                "Feasible",
-                "✅ Yes" if feasible else "⚠️ No",
-                delta="Within budget" if feasible else "Over capacity"
-            )
-
-        # Extract and display conflicts prominently
-        # Check if explanation contains conflicts
-        if "SCHEDULING CONFLICTS DETECTED" in schedule.explanation:
-            # Extract conflict lines from explanation
-            explanation_lines = schedule.explanation.split("\n")
-            conflict_section = False
-            for line in explanation_lines:
-                if "SCHEDULING CONFLICTS DETECTED" in line:
-                    conflict_section = True
-                    st.warning("**⚠️ Scheduling Conflicts Detected:**")
-                elif conflict_section and line.strip().startswith("⚠️"):
-                    st.warning(line.strip())
-                elif conflict_section and not line.strip():
-                    break
-
-        # Warning if not feasible
-        if not schedule.is_feasible():
-            st.error("⚠️ **Warning:** This schedule exceeds your available time! Consider removing low-priority tasks or increasing available time.")
-
-        # Display scheduled tasks with enhanced formatting
-        if schedule.scheduled_tasks:
-            st.markdown("**📝 Scheduled Tasks**")
-
-            # Sort scheduled tasks chronologically if they have times
-            from pawpal_system import parse_time_to_minutes
-            sorted_tasks = sorted(
-                schedule.scheduled_tasks,
-                key=lambda t: parse_time_to_minutes(t.preferred_time) if t.preferred_time else 1440
-            )
+        # Sort scheduled tasks chronologically if they have times
+        sorted_tasks = schedule.get_tasks_by_time()
+
+        # Running total of minutes, accumulated in C rather than a Python loop
+        cumulative_times = accumulate(task.duration for task in sorted_tasks)
+
+        task_table.extend(
+            {
+                "Pet": pet_name,
+                "Order": i,
+                "Time": task.preferred_time or "Flexible",
+                "Task": f"{task.name} {_FREQ_BADGE.get(task.frequency, '')}",
+                "Duration": f"{task.duration} min",
+                "Priority": f"{_PRIORITY_EMOJI.get(task.priority, '⚪')} {task.priority.capitalize()}",
+                "Cumulative": f"{cumulative_time} min"
+            }
+            for i, (task, cumulative_time) in enumerate(zip(sorted_tasks, cumulative_times), 1)
+        )
 
-            task_table = []
-            cumulative_time = 0
-            for i, task in enumerate(sorted_tasks, 1):
-                cumulative_time += task.duration
-
-                # Format time display
-                time_display = task.preferred_time if task.preferred_time else "Flexible"
-
-                # Priority with color emoji
-                priority_emoji = {
-                    "high": "🔴",
-                    "medium": "🟡",
-                    "low": "🟢"
-                }.get(task.priority, "⚪")
-
-                # Recurrence badge
-                freq_badge = {
-                    "once": "",
-                    "daily": "🔄",
-                    "biweekly": "📅",
-                    "weekly": "📆",
-                    "monthly": "🗓️",
-                    "quarterly": "📊",
-                    "yearly": "🎂"
-                }.get(task.frequency, "")
-
-                task_table.append({
-                    "Order": i,
-                    "Time": time_display,
-                    "Task": f"{task.name} {freq_badge}",
-                    "Duration": f"{task.duration} min",
-                    "Priority": f"{priority_emoji} {task.priority.capitalize()}",
-                    "Cumulative": f"{cumulative_time} min"
-                })
-
-            st.dataframe(task_table, use_container_width=True, hide_index=True)
-
-            # Success message
-            if schedule.is_feasible():
-                st.success(f"✅ Schedule is feasible! All {len(sorted_tasks)} tasks fit within {schedule.owner.time_available} minutes.")
-
-        # Display explanation
-        st.markdown("**💡 Explanation**")
-        with st.expander("View Scheduling Rationale"):
-            st.info(schedule.explanation)
-
-        st.divider()  # Separator between pets' schedules
+    # Display scheduled tasks with enhanced formatting
+    if task_table:
+        st.markdown("**📝 Scheduled Tasks**")
+        st.dataframe(pd.DataFrame.from_records(task_table), use_container_width=True, hide_index=True)
+
+    # Display schedule details for each pet, one tab per pet
+    pet_tabs = st.tabs([f"🐾 {pet_name}" for pet_name in st.session_state.schedules])
+    for pet_tab, (pet_name, schedule) in zip(pet_tabs, st.session_state.schedules.items()):
+        with pet_tab:
+            st.markdown(f"### 🐾 {pet_name}'s Schedule")
+
+            # Display summary metrics for this pet
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                pet_task_count = len(st.session_state.tasks_by_pet.get(pet_name, []))
+                st.metric(
+                    "Tasks Scheduled",
+                    len(schedule.scheduled_tasks),
+                    delta=f"{len(schedule.scheduled_tasks)} / {pet_task_count}"
+                )
+            with col2:
+                st.metric(
+                    "Total Time",
+                    f"{schedule.total_duration} min",
+                    delta=f"{schedule.total_duration - schedule.owner.time_available} min" if not schedule.is_feasible() else None,
+                    delta_color="inverse"
+                )
+            with col3:
+                feasible = schedule.is_feasible()
+                st.metric(
+                    "Feasible",
+                    "✅ Yes" if feasible else "⚠️ No",
+                    delta="Within budget" if feasible else "Over capacity"
+                )
+
+            # Display conflicts prominently
+            if schedule.conflicts:
+                st.warning("**⚠️ Scheduling Conflicts Detected:**")
+                for conflict in schedule.conflicts:
+                    st.warning(conflict)
+
+            # Warning if not feasible
+            if not schedule.is_feasible():
+                st.error("⚠️ **Warning:** This schedule exceeds your available time! Consider removing low-priority tasks or increasing available time.")
+            elif schedule.scheduled_tasks:
+                st.success(f"✅ Schedule is feasible! All {len(schedule.scheduled_tasks)} tasks fit within {schedule.owner.time_available} minutes.")
+
+            # Display explanation
+            st.markdown("**💡 Explanation**")
+            with st.expander("View Scheduling Rationale"):
+                st.info(schedule.explanation)
 
 else:
     st.info("👆 Click 'Generate Schedule' above to create your optimized daily plan!")
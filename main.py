@@ -4,29 +4,39 @@ PawPal+ Testing Ground
 Testing conflict detection for overlapping task schedules.
 """
 
+import sys
+
 from pawpal_system import Owner, Pet, CareTask, Scheduler
 
+# Line templates shared by every "Tasks created" listing (bound str.format methods)
+TASK_LINE = "  • {0} at {1} ({2} min)".format
+TASK_SPAN_LINE = "  • {0} at {1}-{2:02d}:{3:02d} ({4} min)".format
+UNTIMED_TASK_LINE = "  • {0} ({1} min, no time specified)".format
+
 
 def main():
-    print("=" * 70)
-    print("🐾 PawPal+ Scheduler - Testing Conflict Detection")
-    print("=" * 70)
-    print()
+    # Collect output lines and write them once at the end instead of one print() per line
+    out = []
+
+    out.append("=" * 70)
+    out.append("🐾 PawPal+ Scheduler - Testing Conflict Detection")
+    out.append("=" * 70)
+    out.append("")
 
     # Create owner and pet
     owner = Owner(name="Alice", time_available=300)
     pet = Pet(name="Buddy", type="dog")
 
-    print(f"Owner: {owner.name}")
-    print(f"Pet: {pet}")
-    print(f"Available time: {owner.time_available} minutes")
-    print()
+    out.append(f"Owner: {owner.name}")
+    out.append(f"Pet: {pet}")
+    out.append(f"Available time: {owner.time_available} minutes")
+    out.append("")
 
     # ===== TEST 1: Exact Time Collision =====
-    print("=" * 70)
-    print("⚠️  TEST 1: Exact Time Collision")
-    print("=" * 70)
-    print()
+    out.append("=" * 70)
+    out.append("⚠️  TEST 1: Exact Time Collision")
+    out.append("=" * 70)
+    out.append("")
 
     tasks_collision = [
         CareTask(name="Morning Walk", duration=30, priority="high", preferred_time="08:00"),
@@ -34,23 +44,22 @@ def main():
         CareTask(name="Training Session", duration=45, priority="medium", preferred_time="10:00"),
     ]
 
-    print("Tasks created:")
-    for task in tasks_collision:
-        print(f"  • {task.name} at {task.preferred_time} ({task.duration} min)")
-    print()
+    out.append("Tasks created:")
+    out.extend(TASK_LINE(t.name, t.preferred_time, t.duration) for t in tasks_collision)
+    out.append("")
 
     scheduler1 = Scheduler(owner=owner, pet=pet, tasks=tasks_collision)
     schedule1 = scheduler1.generate_schedule()
 
-    print("Schedule generated:")
-    print(schedule1.explanation)
-    print()
+    out.append("Schedule generated:")
+    out.append(schedule1.explanation)
+    out.append("")
 
     # ===== TEST 2: Overlapping Time Windows =====
-    print("=" * 70)
-    print("⚠️  TEST 2: Overlapping Time Windows")
-    print("=" * 70)
-    print()
+    out.append("=" * 70)
+    out.append("⚠️  TEST 2: Overlapping Time Windows")
+    out.append("=" * 70)
+    out.append("")
 
     tasks_overlap = [
         CareTask(name="Vet Appointment", duration=60, priority="high", preferred_time="14:00"),
@@ -58,30 +67,25 @@ def main():
         CareTask(name="Play Time", duration=20, priority="low", preferred_time="16:00"),
     ]
 
-    print("Tasks created:")
-    for task in tasks_overlap:
-        time_parts = task.preferred_time.split(":")
-        hours = int(time_parts[0])
-        minutes = int(time_parts[1])
-        start_min = hours * 60 + minutes
-        end_min = start_min + task.duration
-        end_hours = end_min // 60
-        end_minutes = end_min % 60
-        print(f"  • {task.name} at {task.preferred_time}-{end_hours:02d}:{end_minutes:02d} ({task.duration} min)")
-    print()
+    out.append("Tasks created:")
+    out.extend(
+        TASK_SPAN_LINE(t.name, t.preferred_time, *divmod(t.end_minutes, 60), t.duration)
+        for t in tasks_overlap
+    )
+    out.append("")
 
     scheduler2 = Scheduler(owner=owner, pet=pet, tasks=tasks_overlap)
     schedule2 = scheduler2.generate_schedule()
 
-    print("Schedule generated:")
-    print(schedule2.explanation)
-    print()
+    out.append("Schedule generated:")
+    out.append(schedule2.explanation)
+    out.append("")
 
     # ===== TEST 3: No Conflicts =====
-    print("=" * 70)
-    print("✅ TEST 3: No Conflicts (Well-Spaced Tasks)")
-    print("=" * 70)
-    print()
+    out.append("=" * 70)
+    out.append("✅ TEST 3: No Conflicts (Well-Spaced Tasks)")
+    out.append("=" * 70)
+    out.append("")
 
     tasks_no_conflict = [
         CareTask(name="Morning Walk", duration=30, priority="high", preferred_time="07:00"),
@@ -89,23 +93,22 @@ def main():
         CareTask(name="Evening Walk", duration=30, priority="medium", preferred_time="18:00"),
     ]
 
-    print("Tasks created:")
-    for task in tasks_no_conflict:
-        print(f"  • {task.name} at {task.preferred_time} ({task.duration} min)")
-    print()
+    out.append("Tasks created:")
+    out.extend(TASK_LINE(t.name, t.preferred_time, t.duration) for t in tasks_no_conflict)
+    out.append("")
 
     scheduler3 = Scheduler(owner=owner, pet=pet, tasks=tasks_no_conflict)
     schedule3 = scheduler3.generate_schedule()
 
-    print("Schedule generated:")
-    print(schedule3.explanation)
-    print()
+    out.append("Schedule generated:")
+    out.append(schedule3.explanation)
+    out.append("")
 
     # ===== TEST 4: Multiple Conflicts =====
-    print("=" * 70)
-    print("⚠️  TEST 4: Multiple Conflicts")
-    print("=" * 70)
-    print()
+    out.append("=" * 70)
+    out.append("⚠️  TEST 4: Multiple Conflicts")
+    out.append("=" * 70)
+    out.append("")
 
     tasks_multiple = [
         CareTask(name="Task A", duration=30, priority="high", preferred_time="09:00"),
@@ -114,23 +117,22 @@ def main():
         CareTask(name="Task D", duration=20, priority="medium", preferred_time="11:00"),
     ]
 
-    print("Tasks created:")
-    for task in tasks_multiple:
-        print(f"  • {task.name} at {task.preferred_time} ({task.duration} min)")
-    print()
+    out.append("Tasks created:")
+    out.extend(TASK_LINE(t.name, t.preferred_time, t.duration) for t in tasks_multiple)
+    out.append("")
 
     scheduler4 = Scheduler(owner=owner, pet=pet, tasks=tasks_multiple)
     schedule4 = scheduler4.generate_schedule()
 
-    print("Schedule generated:")
-    print(schedule4.explanation)
-    print()
+    out.append("Schedule generated:")
+    out.append(schedule4.explanation)
+    out.append("")
 
     # ===== TEST 5: Tasks Without Times (No Conflicts) =====
-    print("=" * 70)
-    print("✅ TEST 5: Tasks Without Preferred Times")
-    print("=" * 70)
-    print()
+    out.append("=" * 70)
+    out.append("✅ TEST 5: Tasks Without Preferred Times")
+    out.append("=" * 70)
+    out.append("")
 
     tasks_no_time = [
         CareTask(name="Brush Fur", duration=20, priority="low"),
@@ -138,23 +140,22 @@ def main():
         CareTask(name="Clean Toys", duration=10, priority="low"),
     ]
 
-    print("Tasks created (no preferred times):")
-    for task in tasks_no_time:
-        print(f"  • {task.name} ({task.duration} min, no time specified)")
-    print()
+    out.append("Tasks created (no preferred times):")
+    out.extend(UNTIMED_TASK_LINE(t.name, t.duration) for t in tasks_no_time)
+    out.append("")
 
     scheduler5 = Scheduler(owner=owner, pet=pet, tasks=tasks_no_time)
     schedule5 = scheduler5.generate_schedule()
 
-    print("Schedule generated:")
-    print(schedule5.explanation)
-    print()
+    out.append("Schedule generated:")
+    out.append(schedule5.explanation)
+    out.append("")
 
     # ===== TEST 6: Direct Conflict Detection Method =====
-    print("=" * 70)
-    print("🔍 TEST 6: Direct Conflict Detection Method")
-    print("=" * 70)
-    print()
+    out.append("=" * 70)
+    out.append("🔍 TEST 6: Direct Conflict Detection Method")
+    out.append("=" * 70)
+    out.append("")
 
     conflict_tasks = [
         CareTask(name="Walk", duration=30, priority="high", preferred_time="10:00"),
@@ -164,34 +165,35 @@ def main():
     scheduler6 = Scheduler(owner=owner, pet=pet, tasks=conflict_tasks)
     conflicts = scheduler6.handle_conflicts()
 
-    print(f"Tasks to check:")
-    for task in conflict_tasks:
-        print(f"  • {task.name} at {task.preferred_time} ({task.duration} min)")
-    print()
+    out.append(f"Tasks to check:")
+    out.extend(TASK_LINE(t.name, t.preferred_time, t.duration) for t in conflict_tasks)
+    out.append("")
 
     if conflicts:
-        print(f"Conflicts detected ({len(conflicts)}):")
-        for conflict in conflicts:
-            print(f"  {conflict}")
+        out.append(f"Conflicts detected ({len(conflicts)}):")
+        out.extend(f"  {conflict}" for conflict in conflicts)
     else:
-        print("✅ No conflicts detected")
-    print()
+        out.append("✅ No conflicts detected")
+    out.append("")
 
     # ===== Summary =====
-    print("=" * 70)
-    print("📊 Summary")
-    print("=" * 70)
-    print(f"✅ Exact time collision: Detected and reported")
-    print(f"✅ Overlapping time windows: Detected and reported")
-    print(f"✅ No conflicts (well-spaced): No warnings")
-    print(f"✅ Multiple conflicts: All conflicts reported")
-    print(f"✅ Tasks without times: No false positives")
-    print(f"✅ Direct method call: Returns conflict list")
-    print()
-
-    print("=" * 70)
-    print("✅ All Conflict Detection Tests Complete!")
-    print("=" * 70)
+    out.append("=" * 70)
+    out.append("📊 Summary")
+    out.append("=" * 70)
+    out.append(f"✅ Exact time collision: Detected and reported")
+    out.append(f"✅ Overlapping time windows: Detected and reported")
+    out.append(f"✅ No conflicts (well-spaced): No warnings")
+    out.append(f"✅ Multiple conflicts: All conflicts reported")
+    out.append(f"✅ Tasks without times: No false positives")
+    out.append(f"✅ Direct method call: Returns conflict list")
+    out.append("")
+
+    out.append("=" * 70)
+    out.append("✅ All Conflict Detection Tests Complete!")
+    out.append("=" * 70)
+
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
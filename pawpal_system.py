@@ -4,16 +4,27 @@ PawPal+ Scheduling System
 Core classes for managing pet care tasks and generating daily schedules.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from datetime import date as date_type, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from typing import Optional, ClassVar
-import uuid
+import bisect
+import heapq
+import itertools
+
+
+# "00".."59" -> int, for the "HH:MM" fast path in parse_time_to_minutes
+_TWO_DIGITS: dict[str, int] = {f"{n:02d}": n for n in range(60)}
+# Hour fields the fast path accepts: "0".."9" plus "00".."23"
+_HOUR_DIGITS: dict[str, int] = {**{str(n): n for n in range(10)}, **{f"{n:02d}": n for n in range(24)}}
 
 
 def parse_time_to_minutes(time_str: str) -> int:
     """Parse time string in HH:MM or HH:MM AM/PM format to total minutes since midnight.
 
     Supports both 24-hour format (e.g., "14:30") and 12-hour format (e.g., "2:30 PM").
+    None, empty, non-string and unparseable input all return 1440 (end of day).
 
     Args:
         time_str: Time string in "HH:MM" or "HH:MM AM/PM" format
@@ -29,9 +40,46 @@ def parse_time_to_minutes(time_str: str) -> int:
         - "12:00 AM" → 0 (midnight)
         - "12:00 PM" → 720 (noon)
     """
-    if not time_str:
-        return 1440  # End of day for None/empty values
+    if not time_str or not isinstance(time_str, str):
+        return 1440  # End of day for None/empty/non-string values
+
+    return _parse_time_cached(time_str)
+
+
+@lru_cache(maxsize=1024)
+def _parse_time_cached(time_str: str) -> int:
+    """Parse a non-empty time string for parse_time_to_minutes.
+
+    Memoized: tasks reuse a handful of distinct time strings, and a cache hit
+    is cheaper than even the fast path below. Only strings reach the cache.
+    """
+    # Fast path for the shapes the app produces ("H:MM"/"HH:MM", optionally
+    # " AM"/" PM"): character indexing and table lookups replace
+    # strip/upper/replace/split/int(); anything else takes the general path
+    meridiem = time_str[-2:]
+    if meridiem in ("AM", "PM") and time_str[-3:-2] == " ":
+        core = time_str[:-3]
+    else:
+        meridiem = None
+        core = time_str
+    colon = len(core) - 3
+    if (colon == 1 or colon == 2) and core[colon] == ":":
+        hours = _HOUR_DIGITS.get(core[:colon])
+        minutes = _TWO_DIGITS.get(core[colon + 1:])
+        if hours is not None and minutes is not None:
+            if meridiem == "AM":
+                if hours == 12:
+                    hours = 0  # 12:00 AM = midnight
+            elif meridiem == "PM" and hours != 12:
+                hours += 12
+            if hours < 24:
+                return hours * 60 + minutes
+
+    return _parse_general_time(time_str)
 
+
+def _parse_general_time(time_str: str) -> int:
+    """Parse any time string the _parse_time_cached fast path rejects (padding, case, odd forms)."""
     time_str = time_str.strip().upper()
 
     # Check for AM/PM format
@@ -64,17 +112,97 @@ def parse_time_to_minutes(time_str: str) -> int:
 
         return hours * 60 + minutes
 
-    except (ValueError, IndexError, AttributeError):
+    except (ValueError, IndexError):
         return 1440  # Invalid format sorts to end
 
 
-@dataclass
+_task_ids = itertools.count(1)  # Process-wide source of task IDs
+
+
+def _new_task_id() -> str:
+    """Return the next task ID as 8 hex digits (e.g. "0000002a").
+
+    IDs only need to be unique within the running process, so a monotonic
+    counter replaces uuid4 (no random bytes or UUID formatting per task).
+    """
+    return f"{next(_task_ids):08x}"
+
+
+# Shared C-level key functions (built once, not per call or per insert)
+_EDIT_VERSION = attrgetter("edit_version")
+_TIME_MINUTES = attrgetter("time_minutes")
+
+
+def _task_state_key(tasks: list) -> tuple:
+    """Cache key for a task list: each task's identity and edit_version (built with C-level map)."""
+    return (tuple(map(id, tasks)), tuple(map(_EDIT_VERSION, tasks)))
+
+
+def _format_conflict(task1: "CareTask", task2: "CareTask") -> str:
+    """Format the warning for two overlapping tasks."""
+    if task1.time_minutes == task2.time_minutes:
+        # Exact same start time
+        return (
+            f"⚠️  TIME CONFLICT: '{task1.name}' and '{task2.name}' "
+            f"both scheduled at {task1.preferred_time}"
+        )
+    # Overlapping time windows
+    return (
+        f"⚠️  TIME OVERLAP: '{task1.name}' ({task1.preferred_time}, "
+        f"{task1.duration} min) overlaps with '{task2.name}' "
+        f"({task2.preferred_time}, {task2.duration} min)"
+    )
+
+
+def sort_tasks_by_time(tasks: list) -> list:
+    """Sort tasks by preferred_time in HH:MM or HH:MM AM/PM format.
+
+    Pure helper so callers that only need a chronological view don't have
+    to build a Scheduler. Tasks without preferred_time (None) are placed at the end.
+
+    Args:
+        tasks: Iterable of CareTask objects
+
+    Returns:
+        New list of tasks in chronological order
+    """
+    return sorted(tasks, key=_TIME_MINUTES)
+
+
+def _sweep_overlaps(starts: list[int], ends: list[int]) -> list[tuple[int, int]]:
+    """Return index pairs (i, j), i < j, of intervals [start, end) that overlap.
+
+    Sweep line: visit intervals in start order while a min-heap holds the end
+    times of intervals still running. Anything left in the heap after popping
+    those that ended at or before the new start overlaps it. O(n log n + k)
+    for k overlapping pairs. Works on plain ints only, so it has no
+    dependence on CareTask.
+
+    Returns:
+        Pairs sorted by (i, j), i.e. the order a pairwise scan would find them
+    """
+    heappush, heappop = heapq.heappush, heapq.heappop
+    active: list[tuple[int, int]] = []  # Min-heap of (end, index)
+    pairs = []
+    for j in sorted(range(len(starts)), key=starts.__getitem__):
+        start = starts[j]
+        while active and active[0][0] <= start:
+            heappop(active)
+        for _, i in active:
+            pairs.append((i, j) if i < j else (j, i))
+        heappush(active, (ends[j], j))
+
+    pairs.sort()
+    return pairs
+
+
+@dataclass(slots=True)
 class Owner:
     """Represents a pet owner with time constraints and preferences."""
 
     name: str
     time_available: int = 480  # minutes, default 8 hours
-    preferences: dict = field(default_factory=dict)
+    preferences: Optional[dict] = None  # Created on first update_preferences(); None means no preferences
 
     def get_available_time(self) -> int:
         """Return the available time in minutes."""
@@ -88,6 +216,8 @@ class Owner:
 
     def update_preferences(self, **kwargs) -> None:
         """Update owner preferences."""
+        if self.preferences is None:
+            self.preferences = {}
         self.preferences.update(kwargs)
 
     def has_time_for(self, duration: int) -> bool:
@@ -95,16 +225,37 @@ class Owner:
         return self.time_available >= duration
 
 
-@dataclass
+@dataclass(slots=True)
 class Pet:
     """Represents a pet with basic information."""
 
+    # Field names update_info may assign (filled in once the class is built)
+    _UPDATABLE_FIELDS: ClassVar[frozenset[str]] = frozenset()
+
     name: str
     type: str
     breed: str = ""
     age: int = 0
     special_needs: list = field(default_factory=list)
     tasks: list = field(default_factory=list)
+    # task_id -> CareTask for O(1) membership and removal; rebuilt when tasks is replaced or edited directly
+    _task_index: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Index any tasks passed to the constructor."""
+        self._reindex()
+
+    def _reindex(self) -> dict:
+        """Rebuild the task_id index from the tasks list and return it."""
+        self._task_index = index = {task.task_id: task for task in self.tasks}
+        return index
+
+    def _synced_index(self) -> dict:
+        """Return the task_id index, rebuilding it if tasks changed size outside add/remove_task."""
+        index = self._task_index
+        if len(index) != len(self.tasks):
+            index = self._reindex()
+        return index
 
     def get_info(self) -> str:
         """Return pet information as a formatted string."""
@@ -119,31 +270,52 @@ class Pet:
 
     def update_info(self, **kwargs) -> None:
         """Update pet information."""
+        updatable = self._UPDATABLE_FIELDS
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in updatable:
                 setattr(self, key, value)
+        if "tasks" in kwargs:
+            self._reindex()
 
     def add_task(self, task) -> None:
         """Add a task to this pet's task list."""
+        index = self._synced_index()
         self.tasks.append(task)
+        index[task.task_id] = task
+
+    def remove_task(self, task_id: str) -> None:
+        """Remove a task from this pet by ID."""
+        task = self._synced_index().pop(task_id, None)
+        if task is not None:
+            self.tasks.remove(task)
 
     def get_task_count(self) -> int:
         """Return the number of tasks assigned to this pet."""
         return len(self.tasks)
 
+    def __contains__(self, task) -> bool:
+        """Check whether a task belongs to this pet (O(1), by task_id)."""
+        return getattr(task, "task_id", None) in self._synced_index()
+
     def __str__(self) -> str:
         """Return string representation of the pet."""
         return f"{self.name} the {self.type}"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class CareTask:
-    """Represents a single pet care task with priority and duration."""
+    """Represents a single pet care task with priority and duration.
+
+    Tasks are identified by task_id: two tasks are equal (and hash alike)
+    when their IDs match, regardless of the other fields.
+    """
 
     # Class constants for validation (defined before instance fields)
-    VALID_PRIORITIES: ClassVar[list[str]] = ["low", "medium", "high"]
+    VALID_PRIORITIES: ClassVar[frozenset[str]] = frozenset(("low", "medium", "high"))
     PRIORITY_VALUES: ClassVar[dict[str, int]] = {"high": 3, "medium": 2, "low": 1}
-    VALID_FREQUENCIES: ClassVar[list[str]] = ["once", "daily", "biweekly", "weekly", "monthly", "quarterly", "yearly"]
+    VALID_FREQUENCIES: ClassVar[frozenset[str]] = frozenset(
+        ("once", "daily", "biweekly", "weekly", "monthly", "quarterly", "yearly")
+    )
     FREQUENCY_DAYS: ClassVar[dict[str, int]] = {
         "daily": 1,
         "biweekly": 14,
@@ -152,13 +324,21 @@ class CareTask:
         "quarterly": 90,
         "yearly": 365
     }
+    # Prebuilt offsets so each rollover skips constructing a timedelta
+    FREQUENCY_DELTAS: ClassVar[dict[str, timedelta]] = {
+        freq: timedelta(days=days) for freq, days in FREQUENCY_DAYS.items()
+    }
+    # Field names update_task may assign (filled in once the class is built)
+    _UPDATABLE_FIELDS: ClassVar[frozenset[str]] = frozenset()
+    # Fields the derived time/priority values are computed from
+    _SCHEDULING_FIELDS: ClassVar[frozenset[str]] = frozenset(("priority", "duration", "preferred_time"))
 
     # Instance fields
     name: str
     duration: int
     priority: str
     task_type: str = ""
-    task_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    task_id: str = field(default_factory=_new_task_id)
     preferred_time: Optional[str] = None
     notes: str = ""
     completed: bool = False
@@ -166,6 +346,23 @@ class CareTask:
     due_date: Optional[date_type] = None  # When the task is due
     pet_name: str = ""  # Name of pet this task belongs to (for multi-pet support)
 
+    # Derived fields (set by __post_init__ and refreshed by update_task, not passed to __init__)
+    time_minutes: int = field(init=False, repr=False, compare=False)  # Parsed preferred_time, 1440 if unset
+    end_minutes: int = field(init=False, repr=False, compare=False)  # time_minutes + duration
+    priority_value: int = field(init=False, repr=False, compare=False)  # PRIORITY_VALUES[priority]
+    # Bumped when update_task changes priority/duration/preferred_time, so Scheduler caches can detect edits
+    edit_version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __eq__(self, other):
+        """Compare tasks by task_id."""
+        if not isinstance(other, CareTask):
+            return NotImplemented
+        return self.task_id == other.task_id
+
+    def __hash__(self):
+        """Hash by task_id, consistent with __eq__."""
+        return hash(self.task_id)
+
     def __post_init__(self):
         """Validate task after initialization."""
         # Normalize priority to lowercase
@@ -175,6 +372,8 @@ class CareTask:
         if not self.task_type:
             self.task_type = self.name
 
+        self._refresh_derived()
+
         # Validate the task
         if not self.is_valid():
             raise ValueError(f"Invalid task: {self._get_validation_errors()}")
@@ -189,14 +388,26 @@ class CareTask:
 
     def get_priority_value(self) -> int:
         """Return numeric priority value for sorting (high=3, medium=2, low=1)."""
-        return self.PRIORITY_VALUES.get(self.priority, 1)
+        return self.priority_value
+
+    def _refresh_derived(self) -> None:
+        """Recompute time_minutes, end_minutes and priority_value from their source fields."""
+        start = parse_time_to_minutes(self.preferred_time)
+        self.time_minutes = start
+        self.end_minutes = start + self.duration
+        self.priority_value = self.PRIORITY_VALUES.get(self.priority, 1)
 
     def update_task(self, **kwargs) -> None:
         """Update task attributes."""
+        updatable = self._UPDATABLE_FIELDS
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in updatable:
                 setattr(self, key, value)
 
+        if not self._SCHEDULING_FIELDS.isdisjoint(kwargs):
+            self._refresh_derived()
+            self.edit_version += 1
+
         # Re-validate after update
         if not self.is_valid():
             raise ValueError(f"Update would make task invalid: {self._get_validation_errors()}")
@@ -217,31 +428,40 @@ class CareTask:
         if self.duration <= 0:
             errors.append(f"duration must be positive (got {self.duration})")
         if self.priority not in self.VALID_PRIORITIES:
-            errors.append(f"priority must be one of {self.VALID_PRIORITIES} (got '{self.priority}')")
+            valid = sorted(self.VALID_PRIORITIES, key=self.PRIORITY_VALUES.__getitem__)
+            errors.append(f"priority must be one of {valid} (got '{self.priority}')")
         return ", ".join(errors)
 
-    def _get_next_due_date(self) -> Optional[date_type]:
+    def _get_next_due_date(self, today: Optional[date_type] = None) -> Optional[date_type]:
         """Calculate next due date based on task frequency.
 
-        Uses FREQUENCY_DAYS mapping for O(1) lookup. Returns None for
-        non-recurring tasks or unrecognized frequencies.
+        Uses the FREQUENCY_DELTAS mapping (FREQUENCY_DAYS as timedeltas) for
+        O(1) lookup. Returns None for non-recurring tasks or unrecognized
+        frequencies.
+
+        Args:
+            today: Base date for tasks without a due_date (defaults to date.today())
 
         Returns:
             Next due date, or None if task is not recurring.
         """
-        days_to_add = self.FREQUENCY_DAYS.get(self.frequency)
-        if days_to_add is None:
+        delta = self.FREQUENCY_DELTAS.get(self.frequency)
+        if delta is None:
             return None
 
-        base_date = self.due_date or date_type.today()
-        return base_date + timedelta(days=days_to_add)
+        base_date = self.due_date or today or date_type.today()
+        return base_date + delta
 
-    def mark_complete(self) -> Optional['CareTask']:
+    def mark_complete(self, today: Optional[date_type] = None) -> Optional['CareTask']:
         """Mark the task as completed.
 
         For recurring tasks (daily/weekly), automatically creates a new instance
         for the next occurrence using the helper method _get_next_due_date().
 
+        Args:
+            today: Base date for tasks without a due_date. Callers completing
+                many tasks can read the clock once and pass it in.
+
         Returns:
             New CareTask instance if task is recurring, None otherwise.
         """
@@ -252,22 +472,37 @@ class CareTask:
             return None
 
         # Calculate next due date using helper
-        next_due_date = self._get_next_due_date()
+        next_due_date = self._get_next_due_date(today)
         if next_due_date is None:
             return None
 
-        # Create new task instance for next occurrence
-        return CareTask(
-            name=self.name,
-            duration=self.duration,
-            priority=self.priority,
-            task_type=self.task_type,
-            preferred_time=self.preferred_time,
-            notes=self.notes,
-            frequency=self.frequency,
-            due_date=next_due_date,
-            pet_name=self.pet_name
-        )
+        # Create new task instance for next occurrence (copies every other field)
+        return replace(self, task_id=_new_task_id(), due_date=next_due_date, completed=False)
+
+    def expand(self, n: int, start: Optional[date_type] = None) -> list['CareTask']:
+        """Create the next n occurrences of a recurring task in one pass.
+
+        Equivalent to completing the task and each successor in turn, without
+        marking anything complete. Dates advance by one prebuilt timedelta
+        and the clock is read at most once.
+
+        Args:
+            n: Number of future occurrences to create
+            start: Base date (defaults to due_date, then today)
+
+        Returns:
+            New CareTask instances in date order (empty if not recurring).
+        """
+        delta = self.FREQUENCY_DELTAS.get(self.frequency)
+        if delta is None or n <= 0:
+            return []
+
+        due = start or self.due_date or date_type.today()
+        occurrences = []
+        for _ in range(n):
+            due += delta
+            occurrences.append(replace(self, task_id=_new_task_id(), due_date=due, completed=False))
+        return occurrences
 
     def is_completed(self) -> bool:
         """Check if the task is completed."""
@@ -279,17 +514,57 @@ class CareTask:
         return f"[{status}] {self.name} ({self.duration} min, {self.priority} priority)"
 
 
+# Constructor fields only: derived fields like time_minutes are kept in sync, not assigned
+Pet._UPDATABLE_FIELDS = frozenset(f.name for f in fields(Pet) if f.init)
+# task_id is identity (eq/hash and Pet lookups use it), so update_task never reassigns it
+CareTask._UPDATABLE_FIELDS = frozenset(f.name for f in fields(CareTask) if f.init) - {"task_id"}
+
+
 class Schedule:
     """Represents a daily care schedule with tasks and explanations."""
 
+    # Fixed attribute set, matching the slotted dataclasses above
+    __slots__ = (
+        "date",
+        "owner",
+        "pet",
+        "scheduled_tasks",
+        "_tasks_by_id",
+        "_tasks_by_time",
+        "total_duration",
+        "_explanation",
+        "excluded_tasks",
+        "conflicts",
+    )
+
     def __init__(self, owner: Owner, pet: Pet, date=None):
         """Initialize a schedule for a specific owner, pet, and date."""
         self.date = date if date else date_type.today().isoformat()
         self.owner = owner
         self.pet = pet
         self.scheduled_tasks: list[CareTask] = []
+        self._tasks_by_id: dict[str, CareTask] = {}  # Index of scheduled_tasks by task_id
+        self._tasks_by_time: list[CareTask] = []  # scheduled_tasks kept in time order
         self.total_duration: int = 0
-        self.explanation: str = ""
+        self._explanation: Optional[str] = ""  # None = build on next read (see explanation)
+        self.excluded_tasks: list[CareTask] = []  # Tasks left out for lack of time
+        self.conflicts: list[str] = []  # Conflict warnings found during generation
+
+    @property
+    def explanation(self) -> str:
+        """Return the explanation text, building it on first read if deferred.
+
+        Scheduler.generate_schedule sets it to None so that callers that never
+        show the text skip the formatting work entirely.
+        """
+        if self._explanation is None:
+            self._explanation = self._describe_full()
+        return self._explanation
+
+    @explanation.setter
+    def explanation(self, text: Optional[str]) -> None:
+        """Set the explanation text, or None to build it on next read."""
+        self._explanation = text
 
     def add_task(self, task: CareTask, time_slot=None) -> None:
         """Add a task to the schedule.
@@ -301,32 +576,56 @@ class Schedule:
         Raises:
             ValueError: If task with same ID already exists in schedule
         """
-        # Check for duplicate task ID
-        if any(t.task_id == task.task_id for t in self.scheduled_tasks):
+        # Check for duplicate task ID (O(1) via the ID index)
+        if task.task_id in self._tasks_by_id:
             raise ValueError(f"Task with ID {task.task_id} already exists in schedule")
 
+        self._tasks_by_id[task.task_id] = task
         self.scheduled_tasks.append(task)
-        self.calculate_total_duration()
+        # Insert after equal times so ties keep insertion order, like a stable sort
+        bisect.insort_right(self._tasks_by_time, task, key=_TIME_MINUTES)
+        self.total_duration += task.duration  # Maintained incrementally, no re-sum
 
     def remove_task(self, task_id: str) -> None:
         """Remove a task from the schedule by ID."""
-        self.scheduled_tasks = [t for t in self.scheduled_tasks if t.task_id != task_id]
-        self.calculate_total_duration()
+        task = self._tasks_by_id.pop(task_id, None)
+        if task is None:
+            return
+        self.scheduled_tasks.remove(task)
+        self._tasks_by_time.remove(task)
+        self.total_duration -= task.duration
 
     def get_schedule(self) -> list[CareTask]:
         """Return the list of scheduled tasks."""
         return self.scheduled_tasks
 
+    def get_tasks_by_time(self) -> list[CareTask]:
+        """Return scheduled tasks in chronological order (untimed tasks last).
+
+        Kept sorted on insertion with bisect, so no re-sort is needed. Equivalent
+        to sort_tasks_by_time(scheduled_tasks) as long as task times aren't
+        changed after being scheduled.
+        """
+        return list(self._tasks_by_time)
+
     def calculate_total_duration(self) -> int:
-        """Calculate and return total duration of all scheduled tasks."""
+        """Calculate and return total duration of all scheduled tasks.
+
+        add_task/remove_task keep total_duration current; call this to resync
+        only if a scheduled task's duration was changed in place.
+        """
         self.total_duration = sum(task.duration for task in self.scheduled_tasks)
         return self.total_duration
 
     def generate_explanation(self) -> str:
         """Generate human-readable explanation of the schedule."""
+        self.explanation = self._describe_tasks()
+        return self.explanation
+
+    def _describe_tasks(self) -> str:
+        """Build the summary of scheduled tasks used by generate_explanation."""
         if not self.scheduled_tasks:
-            self.explanation = "No tasks scheduled."
-            return self.explanation
+            return "No tasks scheduled."
 
         parts = []
         parts.append(f"Schedule for {self.pet.name} (Owner: {self.owner.name})")
@@ -340,8 +639,25 @@ class Schedule:
         if not self.is_feasible():
             parts.append("\n⚠️  WARNING: Schedule exceeds available time!")
 
-        self.explanation = "\n".join(parts)
-        return self.explanation
+        return "\n".join(parts)
+
+    def _describe_full(self) -> str:
+        """Build the summary plus excluded tasks and conflicts (collected as lines, joined once)."""
+        parts = [self._describe_tasks()]
+
+        # Add information about excluded tasks
+        if self.excluded_tasks:
+            parts.append("\nExcluded tasks due to time constraints:")
+            parts.extend(
+                f"  • {task.name} ({task.duration} min, {task.priority} priority)"
+                for task in self.excluded_tasks
+            )
+
+        if self.conflicts:
+            parts.append("\n⚠️  SCHEDULING CONFLICTS DETECTED:")
+            parts.extend(f"  {conflict}" for conflict in self.conflicts)
+
+        return "\n".join(parts)
 
     def is_feasible(self) -> bool:
         """Check if schedule fits within owner's available time."""
@@ -355,11 +671,22 @@ class Schedule:
 class Scheduler:
     """Orchestrates schedule generation using constraints and priorities."""
 
-    def __init__(self, owner: Owner, pet: Pet, tasks: Optional[list] = None):
-        """Initialize scheduler with owner, pet, and optional task list."""
+    def __init__(self, owner: Owner, pet: Pet, tasks: Optional[list] = None, avoid_overlaps: bool = False):
+        """Initialize scheduler with owner, pet, and optional task list.
+
+        Args:
+            avoid_overlaps: If True, never select two timed tasks whose windows
+                overlap (see filter_by_time_constraint). Defaults to False, which
+                schedules overlapping tasks and reports them as conflicts.
+        """
         self.owner = owner
         self.pet = pet
         self.tasks: list[CareTask] = tasks if tasks else []
+        self.avoid_overlaps = avoid_overlaps
+        self._sorted_cache: Optional[list[CareTask]] = None  # Last sort_by_priority result
+        self._sorted_key: Optional[tuple] = None  # _task_state_key of the tasks it was built from
+        self._results: dict[tuple, tuple] = {}  # (time_available, avoid_overlaps) -> (selected, excluded, conflict pairs)
+        self._results_key: Optional[tuple] = None  # Task state the cached results belong to
 
     def generate_schedule(self) -> Schedule:
         """Generate an optimized schedule based on priorities and constraints.
@@ -368,7 +695,15 @@ class Scheduler:
         1. Sort tasks by priority (high → low), then by duration (short → long)
         2. Filter tasks to fit within available time
         3. Create schedule and add selected tasks
-        4. Generate explanation including excluded tasks
+        4. Record excluded tasks and conflicts on the schedule
+        5. Defer the explanation text (built on first read of schedule.explanation)
+
+        Steps 1-2 and the overlapping pairs are memoized per (time_available,
+        avoid_overlaps) while the task list and the tasks' priority, duration
+        and preferred_time are unchanged; messages are formatted on every call
+        and each call returns a new Schedule. The memo lives on this Scheduler,
+        so it only helps callers that reuse one (the Streamlit app caches whole
+        schedules per session instead).
         """
         schedule = Schedule(self.owner, self.pet)
 
@@ -377,33 +712,39 @@ class Scheduler:
             schedule.explanation = "No tasks provided to schedule."
             return schedule
 
-        # Step 1: Sort by priority
-        sorted_tasks = self.sort_by_priority()
+        # Drop cached results once the tasks they were computed from change
+        tasks_key = _task_state_key(self.tasks)
+        if tasks_key != self._results_key:
+            self._results.clear()
+            self._results_key = tasks_key
+
+        key = (self.owner.time_available, self.avoid_overlaps)
+        cached = self._results.get(key)
+        if cached is None:
+            # Step 1: Sort by priority (reusing the state key built above)
+            sorted_tasks = self._sorted_by_priority(tasks_key)
+
+            # Step 2: Filter by time constraint
+            if self.owner.time_available <= 0:
+                # No budget: every task is excluded (durations are validated positive)
+                selected_tasks, excluded_tasks = [], sorted_tasks
+            else:
+                selected_tasks, excluded_tasks = self.filter_by_time_constraint(sorted_tasks)
 
-        # Step 2: Filter by time constraint
-        selected_tasks, excluded_tasks = self.filter_by_time_constraint(sorted_tasks)
+            cached = self._results[key] = (selected_tasks, excluded_tasks, self._conflict_pairs(selected_tasks))
+        selected_tasks, excluded_tasks, conflict_pairs = cached
 
         # Step 3: Add selected tasks to schedule
         for task in selected_tasks:
             schedule.add_task(task)
 
-        # Step 4: Generate explanation
-        schedule.generate_explanation()
+        # Step 4: Record excluded tasks (a copy, so edits can't reach the cache) and
+        # format conflicts fresh, so renamed tasks show their current names
+        schedule.excluded_tasks = list(excluded_tasks)
+        schedule.conflicts = [_format_conflict(task1, task2) for task1, task2 in conflict_pairs]
 
-        # Add information about excluded tasks
-        if excluded_tasks:
-            exclusion_text = f"\n\nExcluded tasks due to time constraints:"
-            for task in excluded_tasks:
-                exclusion_text += f"\n  • {task.name} ({task.duration} min, {task.priority} priority)"
-            schedule.explanation += exclusion_text
-
-        # Step 5: Detect and report conflicts
-        conflicts = self.detect_conflicts(selected_tasks)
-        if conflicts:
-            conflict_text = f"\n\n⚠️  SCHEDULING CONFLICTS DETECTED:"
-            for conflict in conflicts:
-                conflict_text += f"\n  {conflict}"
-            schedule.explanation += conflict_text
+        # Step 5: Defer the explanation text until something reads it
+        schedule.explanation = None
 
         return schedule
 
@@ -413,11 +754,22 @@ class Scheduler:
         This ensures:
         - High priority tasks are scheduled first
         - Among same priority, shorter tasks come first (better packing)
+
+        The order is cached and reused while the task list holds the same task
+        objects and no task's priority or duration has been changed.
         """
-        return sorted(
-            self.tasks,
-            key=lambda t: (-t.get_priority_value(), t.duration)
-        )
+        return list(self._sorted_by_priority(_task_state_key(self.tasks)))  # Copy so callers can't corrupt the cache
+
+    def _sorted_by_priority(self, key: tuple) -> list[CareTask]:
+        """Return the cached priority order for the task state `key`, re-sorting on a change.
+
+        The returned list is the cache itself; callers must not mutate it.
+        """
+        # The cache keeps the tasks alive, so their ids can't be recycled
+        if key != self._sorted_key:
+            self._sorted_cache = sorted(self.tasks, key=lambda t: (-t.priority_value, t.duration))
+            self._sorted_key = key
+        return self._sorted_cache
 
     def sort_by_time(self) -> list[CareTask]:
         """Sort tasks by preferred_time in HH:MM or HH:MM AM/PM format.
@@ -425,12 +777,7 @@ class Scheduler:
         Supports both 24-hour (e.g., "14:30") and 12-hour (e.g., "2:30 PM") formats.
         Tasks without preferred_time (None) are placed at the end.
         """
-        def time_sort_key(task: CareTask) -> int:
-            if task.preferred_time is None:
-                return 1440  # End of day
-            return parse_time_to_minutes(task.preferred_time)
-
-        return sorted(self.tasks, key=time_sort_key)
+        return sort_tasks_by_time(self.tasks)
 
     def filter_by_time_constraint(self, sorted_tasks: list[CareTask]) -> tuple[list[CareTask], list[CareTask]]:
         """Filter tasks to fit within available time.
@@ -438,19 +785,66 @@ class Scheduler:
         Greedy algorithm: iterate through sorted tasks and add each task
         if it fits within remaining time.
 
+        When avoid_overlaps is set, overlapping timed tasks are dropped first
+        with the earliest-finish-time greedy, then the same priority-order fill
+        runs over what is left (see _select_non_overlapping).
+
         Returns:
-            tuple: (selected_tasks, excluded_tasks)
+            tuple: (selected_tasks, excluded_tasks), both in sorted_tasks order
         """
-        running_time = 0
+        if self.avoid_overlaps:
+            return self._select_non_overlapping(sorted_tasks)
+
+        remaining = self.owner.time_available  # Read once, not per task
+        selected = []
+        excluded = []
+        select, exclude = selected.append, excluded.append
+
+        for task in sorted_tasks:
+            duration = task.duration
+            if duration <= remaining:
+                select(task)
+                remaining -= duration
+            else:
+                exclude(task)
+
+        return selected, excluded
+
+    def _select_non_overlapping(self, sorted_tasks: list[CareTask]) -> tuple[list[CareTask], list[CareTask]]:
+        """Drop timed tasks that would overlap, then fill the time budget by priority.
+
+        Algorithm: Earliest-Finish-Time Greedy (interval scheduling)
+        1. Sort timed tasks by finish minute, breaking ties by priority (high first)
+        2. Walk once, marking each task that starts at or after the last marked
+           finish as compatible
+        3. Walk sorted_tasks (priority order) and take each untimed or compatible
+           task that still fits in the remaining time
+
+        The finish-time pass only decides which timed tasks can coexist; the
+        budget is spent in priority order, so a low-priority timed task never
+        crowds out a higher-priority untimed one. O(n log n) for the sort plus
+        two linear passes.
+        """
+        compatible = set()
+        last_finish = -1
+        timed = [t for t in sorted_tasks if t.time_minutes < 1440]
+        for task in sorted(timed, key=lambda t: (t.end_minutes, -t.priority_value)):
+            if task.time_minutes >= last_finish:
+                compatible.add(id(task))
+                last_finish = task.end_minutes
+
+        remaining = self.owner.time_available
         selected = []
         excluded = []
+        select, exclude = selected.append, excluded.append
 
         for task in sorted_tasks:
-            if running_time + task.duration <= self.owner.time_available:
-                selected.append(task)
-                running_time += task.duration
+            duration = task.duration
+            if duration <= remaining and (task.time_minutes >= 1440 or id(task) in compatible):
+                select(task)
+                remaining -= duration
             else:
-                excluded.append(task)
+                exclude(task)
 
         return selected, excluded
 
@@ -476,7 +870,7 @@ class Scheduler:
         Returns:
             List of tasks matching the completion status.
         """
-        return [task for task in self.tasks if task.is_completed() == completed]
+        return [task for task in self.tasks if task.completed == completed]
 
     def filter_by_pet_name(self, pet_name: str) -> list[CareTask]:
         """Filter tasks by pet name.
@@ -501,51 +895,37 @@ class Scheduler:
         - Tasks with the same preferred_time (exact time collision)
         - Tasks with overlapping time windows (start time + duration)
 
+        Algorithm: Sweep line over start times (see _sweep_overlaps)
+        1. Sort timed tasks by start minute (O(n log n))
+        2. Keep a min-heap of active tasks keyed by end minute
+        3. Before each start, pop tasks that ended at or before it;
+           everything left in the heap overlaps the new task
+        Total O(n log n + k) for k conflicting pairs, instead of O(n²) pairs.
+
         Args:
             tasks_to_check: List of tasks to check for conflicts
 
         Returns:
             List of warning messages describing conflicts (empty if no conflicts)
         """
-        conflicts = []
-
-        # Only check tasks that have preferred_time set
-        timed_tasks = [t for t in tasks_to_check if t.preferred_time is not None]
-
-        # Check each pair of tasks for conflicts
-        for i, task1 in enumerate(timed_tasks):
-            for task2 in timed_tasks[i + 1:]:
-                # Parse time for both tasks using helper function
-                start1_minutes = parse_time_to_minutes(task1.preferred_time)
-                start2_minutes = parse_time_to_minutes(task2.preferred_time)
-
-                # Skip if either time is invalid (returns 1440)
-                if start1_minutes >= 1440 or start2_minutes >= 1440:
-                    continue
-
-                end1_minutes = start1_minutes + task1.duration
-                end2_minutes = start2_minutes + task2.duration
-
-                # Check for time overlap
-                # Overlap occurs if: task1 starts before task2 ends AND task2 starts before task1 ends
-                if start1_minutes < end2_minutes and start2_minutes < end1_minutes:
-                    # Format the conflict message
-                    if start1_minutes == start2_minutes:
-                        # Exact same start time
-                        conflict_msg = (
-                            f"⚠️  TIME CONFLICT: '{task1.name}' and '{task2.name}' "
-                            f"both scheduled at {task1.preferred_time}"
-                        )
-                    else:
-                        # Overlapping time windows
-                        conflict_msg = (
-                            f"⚠️  TIME OVERLAP: '{task1.name}' ({task1.preferred_time}, "
-                            f"{task1.duration} min) overlaps with '{task2.name}' "
-                            f"({task2.preferred_time}, {task2.duration} min)"
-                        )
-                    conflicts.append(conflict_msg)
-
-        return conflicts
+        return [_format_conflict(task1, task2) for task1, task2 in self._conflict_pairs(tasks_to_check)]
+
+    def _conflict_pairs(self, tasks_to_check: list[CareTask]) -> list[tuple[CareTask, CareTask]]:
+        """Return the overlapping task pairs behind detect_conflicts' messages."""
+        # Only check tasks that have a valid preferred_time (invalid times parse to 1440)
+        timed_tasks = [
+            t for t in tasks_to_check
+            if t.preferred_time is not None and t.time_minutes < 1440
+        ]
+        if len(timed_tasks) < 2:
+            return []  # Nothing to pair up
+
+        # Sweep the cached integer start/end minutes for overlapping pairs
+        pairs = _sweep_overlaps(
+            [t.time_minutes for t in timed_tasks],
+            [t.end_minutes for t in timed_tasks]
+        )
+        return [(timed_tasks[i], timed_tasks[j]) for i, j in pairs]
 
     def handle_conflicts(self) -> list[str]:
         """Identify and handle scheduling conflicts.
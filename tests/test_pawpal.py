@@ -2,7 +2,7 @@
 Simple tests for PawPal+ scheduling system.
 """
 
-from pawpal_system import Owner, Pet, CareTask, Scheduler, parse_time_to_minutes
+from pawpal_system import Owner, Pet, CareTask, Schedule, Scheduler, parse_time_to_minutes, sort_tasks_by_time
 from datetime import date as date_type, timedelta
 
 
@@ -59,6 +59,36 @@ def test_task_addition_to_pet():
     assert task2 in pet.tasks
 
 
+def test_pet_task_lookup_by_id():
+    """
+    Pet Lookup Test: Tasks passed to the constructor are indexed, and
+    remove_task and `in` work by task_id.
+    """
+    task1 = CareTask(name="Morning Walk", duration=30, priority="high")
+    task2 = CareTask(name="Feed Breakfast", duration=10, priority="high")
+    pet = Pet(name="Buddy", type="dog", tasks=[task1, task2])
+
+    # Assert: Constructor tasks are a plain list and are found by ID
+    assert pet.tasks == [task1, task2]
+    assert task1 in pet
+    assert "Buddy" in repr(pet) and "Morning Walk" in repr(pet)
+
+    # Act: Remove a task by ID
+    pet.remove_task(task1.task_id)
+
+    # Assert: Only the other task remains
+    assert pet.get_task_count() == 1
+    assert task1 not in pet
+    assert pet.tasks == [task2]
+
+    # Act: Edit the list directly, then replace it
+    pet.tasks.append(task1)
+    assert task1 in pet
+    pet.update_info(tasks=[task1])
+    assert task2 not in pet
+    assert pet.tasks == [task1]
+
+
 def test_recurring_task_daily():
     """
     Recurring Task Test: Verify that marking a daily task complete
@@ -311,6 +341,20 @@ def test_recurring_daily_without_due_date():
     assert next_task.due_date == today + timedelta(days=1)
 
 
+def test_recurring_uses_supplied_today():
+    """
+    Recurrence Edge Case: an explicit today is the base for undated tasks
+    and is ignored for tasks that already have a due_date.
+    """
+    base = date_type(2024, 2, 28)
+    undated = CareTask(name="Pill", duration=5, priority="high", frequency="daily")
+    dated = CareTask(name="Bath", duration=20, priority="low", frequency="weekly",
+                     due_date=date_type(2024, 1, 1))
+
+    assert undated.mark_complete(base).due_date == date_type(2024, 2, 29)
+    assert dated.mark_complete(base).due_date == date_type(2024, 1, 8)
+
+
 def test_recurring_task_chain():
     """
     Recurrence Logic: Completing recurring tasks multiple times creates chain.
@@ -334,6 +378,22 @@ def test_recurring_task_chain():
         current = next_task
 
 
+def test_recurring_expand_matches_chain():
+    """
+    Recurrence Logic: expand(n) yields the same dates as completing the
+    task n times, without completing anything.
+    """
+    start = date_type(2024, 1, 1)
+    task = CareTask(name="Bath", duration=20, priority="low", frequency="weekly", due_date=start)
+
+    occurrences = task.expand(3)
+
+    assert [t.due_date for t in occurrences] == [date_type(2024, 1, 8), date_type(2024, 1, 15), date_type(2024, 1, 22)]
+    assert len({t.task_id for t in occurrences} | {task.task_id}) == 4
+    assert not task.completed and not any(t.completed for t in occurrences)
+    assert CareTask(name="Vet", duration=60, priority="high").expand(5) == []
+
+
 def test_recurring_task_preserves_attributes():
     """
     Recurrence Logic: Next occurrence should preserve all task attributes.
@@ -433,6 +493,33 @@ def test_conflict_detection_one_minute_overlap():
     assert len(conflicts) == 1
 
 
+def test_conflict_detection_long_task_spans_many():
+    """
+    Conflict Detection: A long task overlapping several later, non-overlapping
+    tasks should be paired with each of them, and only with them.
+    """
+    owner = Owner(name="Alice", time_available=600)
+    pet = Pet(name="Buddy", type="dog")
+
+    tasks = [
+        CareTask(name="Short 1", duration=20, priority="low", preferred_time="09:30"),
+        CareTask(name="All Morning", duration=180, priority="high", preferred_time="09:00"),
+        CareTask(name="Short 2", duration=20, priority="low", preferred_time="10:30"),
+        CareTask(name="Afternoon", duration=30, priority="low", preferred_time="13:00"),
+    ]
+
+    scheduler = Scheduler(owner=owner, pet=pet, tasks=tasks)
+
+    # Act: Detect conflicts
+    conflicts = scheduler.handle_conflicts()
+
+    # Assert: Only the two short tasks overlap the long one, reported in input order
+    assert len(conflicts) == 2
+    assert conflicts[0].startswith("⚠️  TIME OVERLAP: 'Short 1'")
+    assert conflicts[1].startswith("⚠️  TIME OVERLAP: 'All Morning'")
+    assert not any("Afternoon" in c for c in conflicts)
+
+
 def test_pet_with_no_tasks():
     """
     Edge Case: Pet with no tasks should generate empty schedule.
@@ -451,6 +538,144 @@ def test_pet_with_no_tasks():
     assert schedule.total_duration == 0
 
 
+def test_schedule_add_remove_tracks_total_duration():
+    """
+    Schedule Totals Test: total_duration stays correct as tasks are added
+    and removed, and duplicate task IDs are rejected.
+    """
+    owner = Owner(name="Alice", time_available=60)
+    pet = Pet(name="Buddy", type="dog")
+    schedule = Schedule(owner, pet)
+
+    walk = CareTask(name="Walk", duration=30, priority="high")
+    feed = CareTask(name="Feed", duration=40, priority="high")
+
+    # Act: Add tasks
+    schedule.add_task(walk)
+    schedule.add_task(feed)
+    assert schedule.total_duration == 70
+    assert not schedule.is_feasible()
+
+    # Assert: Duplicate ID rejected without changing the total
+    try:
+        schedule.add_task(walk)
+        assert False, "Expected ValueError for duplicate task ID"
+    except ValueError:
+        pass
+    assert schedule.total_duration == 70
+
+    # Act: Remove a task (unknown IDs are ignored)
+    schedule.remove_task(feed.task_id)
+    schedule.remove_task("missing")
+
+    # Assert: Total and task list updated
+    assert schedule.total_duration == 30
+    assert schedule.scheduled_tasks == [walk]
+    assert schedule.is_feasible()
+    assert schedule.calculate_total_duration() == 30
+
+
+def test_schedule_tasks_by_time_stays_sorted():
+    """
+    Schedule Time Order Test: get_tasks_by_time() returns scheduled tasks in
+    chronological order while scheduled_tasks keeps priority order.
+    """
+    owner = Owner(name="Alice", time_available=300)
+    pet = Pet(name="Buddy", type="dog")
+
+    tasks = [
+        CareTask(name="Dinner", duration=20, priority="high", preferred_time="6:00 PM"),
+        CareTask(name="Brush", duration=10, priority="medium"),
+        CareTask(name="Breakfast", duration=15, priority="medium", preferred_time="07:00"),
+        CareTask(name="Lunch", duration=15, priority="low", preferred_time="12:00"),
+    ]
+
+    schedule = Scheduler(owner=owner, pet=pet, tasks=tasks).generate_schedule()
+
+    # Assert: Time view matches a full sort; priority order untouched
+    assert schedule.get_tasks_by_time() == sort_tasks_by_time(schedule.scheduled_tasks)
+    assert [t.name for t in schedule.get_tasks_by_time()] == ["Breakfast", "Lunch", "Dinner", "Brush"]
+    assert schedule.scheduled_tasks[0].name == "Dinner"
+
+    # Act: Remove a task
+    schedule.remove_task(tasks[2].task_id)
+
+    # Assert: Removed from the time view too
+    assert [t.name for t in schedule.get_tasks_by_time()] == ["Lunch", "Dinner", "Brush"]
+
+
+def test_sort_by_priority_cache_tracks_edits():
+    """
+    Priority Sort Cache Test: repeated sort_by_priority() calls reuse the
+    cached order, but edits to the task list or a task's priority re-sort.
+    """
+    owner = Owner(name="Alice", time_available=120)
+    pet = Pet(name="Buddy", type="dog")
+
+    walk = CareTask(name="Walk", duration=30, priority="low")
+    feed = CareTask(name="Feed", duration=10, priority="high")
+    scheduler = Scheduler(owner=owner, pet=pet, tasks=[walk, feed])
+
+    # Assert: Cached result is stable and safe to mutate
+    first = scheduler.sort_by_priority()
+    first.clear()
+    assert [t.name for t in scheduler.sort_by_priority()] == ["Feed", "Walk"]
+
+    # Act: Edit a priority in place
+    walk.update_task(priority="high")
+    assert [t.name for t in scheduler.sort_by_priority()] == ["Feed", "Walk"]
+    feed.update_task(duration=40)
+    assert [t.name for t in scheduler.sort_by_priority()] == ["Walk", "Feed"]
+
+    # Assert: Creating an unrelated task keeps the cached order
+    cached = scheduler._sorted_cache
+    CareTask(name="Bath", duration=15, priority="low")
+    scheduler.sort_by_priority()
+    assert scheduler._sorted_cache is cached
+
+    # Act: Add a task directly to the list
+    groom = CareTask(name="Groom", duration=5, priority="high")
+    scheduler.tasks.append(groom)
+    assert [t.name for t in scheduler.sort_by_priority()] == ["Groom", "Walk", "Feed"]
+
+
+def test_generate_schedule_reuses_results_until_edit():
+    """
+    Schedule Cache Test: regenerating returns a fresh Schedule each time, and
+    follows changes to time_available and to task times.
+    """
+    owner = Owner(name="Alice", time_available=60)
+    pet = Pet(name="Buddy", type="dog")
+
+    walk = CareTask(name="Walk", duration=30, priority="high", preferred_time="08:00")
+    feed = CareTask(name="Feed", duration=20, priority="medium", preferred_time="08:15")
+    groom = CareTask(name="Groom", duration=40, priority="low")
+    scheduler = Scheduler(owner=owner, pet=pet, tasks=[walk, feed, groom])
+
+    # Assert: Equal but independent schedules
+    first = scheduler.generate_schedule()
+    first.remove_task(walk.task_id)
+    first.conflicts.clear()
+    second = scheduler.generate_schedule()
+    assert second is not first
+    assert [t.name for t in second.scheduled_tasks] == ["Walk", "Feed"]
+    assert len(second.conflicts) == 1
+
+    # Act: More time available
+    owner.time_available = 90
+    assert [t.name for t in scheduler.generate_schedule().scheduled_tasks] == ["Walk", "Feed", "Groom"]
+
+    # Act: Rename a task; conflicts and explanation use the new name
+    walk.update_task(name="Run")
+    renamed = scheduler.generate_schedule()
+    assert "'Run'" in renamed.conflicts[0] and "Walk" not in renamed.conflicts[0]
+    assert "Walk" not in renamed.explanation
+
+    # Act: Move a task so the overlap goes away
+    feed.update_task(preferred_time="09:00")
+    assert scheduler.generate_schedule().conflicts == []
+
+
 def test_zero_time_available():
     """
     Edge Case: Owner with 0 minutes available should exclude all tasks.
@@ -546,6 +771,83 @@ def test_same_priority_shorter_task_first():
     assert schedule.scheduled_tasks[2].duration == 40
 
 
+def test_lower_priority_fills_leftover_time():
+    """
+    Scheduling Logic: When the rest of a priority group is too long, shorter
+    lower-priority tasks still fill the leftover time, in priority order.
+    """
+    owner = Owner(name="Alice", time_available=60)
+    pet = Pet(name="Buddy", type="dog")
+
+    tasks = [
+        CareTask(name="Walk", duration=40, priority="high"),
+        CareTask(name="Groom", duration=30, priority="high"),
+        CareTask(name="Vet", duration=45, priority="high"),
+        CareTask(name="Play", duration=25, priority="medium"),
+        CareTask(name="Treat", duration=5, priority="low"),
+        CareTask(name="Brush", duration=20, priority="low"),
+    ]
+
+    schedule = Scheduler(owner=owner, pet=pet, tasks=tasks).generate_schedule()
+
+    # Assert: Groom + Play + Treat fit (60 min); Walk/Vet and Brush don't
+    assert [t.name for t in schedule.scheduled_tasks] == ["Groom", "Play", "Treat"]
+    assert schedule.total_duration == 60
+    assert "Walk" in schedule.explanation and "Brush" in schedule.explanation
+
+
+def test_avoid_overlaps_keeps_more_compatible_tasks():
+    """
+    Overlap-Free Scheduling: With avoid_overlaps, one long task that blocks
+    several short ones is dropped so the short, compatible tasks all fit.
+    """
+    owner = Owner(name="Alice", time_available=300)
+    pet = Pet(name="Buddy", type="dog")
+
+    tasks = [
+        CareTask(name="Long Hike", duration=120, priority="high", preferred_time="08:00"),
+        CareTask(name="Feed", duration=15, priority="medium", preferred_time="08:00"),
+        CareTask(name="Meds", duration=10, priority="high", preferred_time="08:30"),
+        CareTask(name="Play", duration=20, priority="low", preferred_time="09:00"),
+        CareTask(name="Brush", duration=10, priority="low"),
+    ]
+
+    # Act: Default behavior keeps everything and reports conflicts
+    default_schedule = Scheduler(owner=owner, pet=pet, tasks=tasks).generate_schedule()
+    assert len(default_schedule.scheduled_tasks) == 5
+    assert default_schedule.conflicts
+
+    # Act: Overlap-free selection
+    schedule = Scheduler(owner=owner, pet=pet, tasks=tasks, avoid_overlaps=True).generate_schedule()
+
+    # Assert: Long task dropped, no conflicts, untimed task still fits
+    names = [t.name for t in schedule.scheduled_tasks]
+    assert "Long Hike" not in names
+    assert set(names) == {"Feed", "Meds", "Play", "Brush"}
+    assert schedule.conflicts == []
+
+
+def test_avoid_overlaps_spends_budget_by_priority():
+    """
+    Overlap-Free Budget Test: With avoid_overlaps, a low-priority timed task
+    does not use up time needed by a high-priority untimed task.
+    """
+    owner = Owner(name="Alice", time_available=30)
+    pet = Pet(name="Buddy", type="dog")
+
+    tasks = [
+        CareTask(name="Timed low", duration=30, priority="low", preferred_time="08:00"),
+        CareTask(name="Untimed high", duration=30, priority="high"),
+    ]
+
+    # Act: Only one task fits the budget
+    schedule = Scheduler(owner=owner, pet=pet, tasks=tasks, avoid_overlaps=True).generate_schedule()
+
+    # Assert: Priority decides which one, matching the default mode
+    assert [t.name for t in schedule.scheduled_tasks] == ["Untimed high"]
+    assert [t.name for t in schedule.excluded_tasks] == ["Timed low"]
+
+
 def test_am_pm_time_parsing():
     """
     AM/PM Parsing Test: Verify that parse_time_to_minutes correctly
@@ -569,6 +871,11 @@ def test_am_pm_time_parsing():
     assert parse_time_to_minutes("8:00 am") == 480
     assert parse_time_to_minutes("2:00 pm") == 840  # 2:00 PM = 14:00 = 840 minutes
 
+    # Edge case: missing or non-string input sorts to end of day
+    assert parse_time_to_minutes(None) == 1440
+    assert parse_time_to_minutes(123) == 1440
+    assert parse_time_to_minutes(["08:00"]) == 1440
+
 
 def test_am_pm_sorting():
     """
@@ -640,19 +947,175 @@ def test_am_pm_exact_time_conflict():
     assert "CONFLICT" in conflicts[0]
 
 
+def test_sort_tasks_by_time_matches_scheduler():
+    """
+    Sorting Helper Test: The standalone sort_tasks_by_time() helper should
+    order tasks exactly like Scheduler.sort_by_time() without a Scheduler.
+    """
+    tasks = [
+        CareTask(name="No Time", duration=10, priority="low"),
+        CareTask(name="Evening", duration=20, priority="medium", preferred_time="6:00 PM"),
+        CareTask(name="Morning", duration=15, priority="high", preferred_time="07:30"),
+    ]
+
+    scheduler = Scheduler(owner=Owner(name="Alex"), pet=Pet(name="Buddy", type="dog"), tasks=tasks)
+    sorted_tasks = sort_tasks_by_time(tasks)
+
+    # Assert: Chronological with untimed tasks last, same as the Scheduler method
+    assert [t.name for t in sorted_tasks] == ["Morning", "Evening", "No Time"]
+    assert sorted_tasks == scheduler.sort_by_time()
+
+
+def test_schedule_exposes_conflicts():
+    """
+    Conflict Data Test: generate_schedule() should store detected conflicts
+    on the Schedule as a list, not only inside the explanation text.
+    """
+    owner = Owner(name="Alice", time_available=300)
+    pet = Pet(name="Buddy", type="dog")
+
+    tasks = [
+        CareTask(name="Walk", duration=30, priority="high", preferred_time="08:00"),
+        CareTask(name="Feed", duration=15, priority="high", preferred_time="08:00"),
+    ]
+
+    schedule = Scheduler(owner=owner, pet=pet, tasks=tasks).generate_schedule()
+
+    # Assert: Structured conflicts match the explanation
+    assert len(schedule.conflicts) == 1
+    assert schedule.conflicts[0] in schedule.explanation
+
+
+def test_schedule_explanation_built_on_read():
+    """
+    Lazy Explanation Test: excluded tasks are kept on the Schedule, and the
+    explanation text is built from current state when first read.
+    """
+    owner = Owner(name="Alice", time_available=30)
+    pet = Pet(name="Buddy", type="dog")
+    walk = CareTask(name="Walk", duration=20, priority="high")
+    groom = CareTask(name="Groom", duration=60, priority="low")
+
+    schedule = Scheduler(owner=owner, pet=pet, tasks=[walk, groom]).generate_schedule()
+    assert schedule.excluded_tasks == [groom]
+
+    # Act: Remove before anything reads the explanation
+    schedule.remove_task(walk.task_id)
+
+    # Assert: Text reflects the schedule at read time
+    assert schedule.explanation.startswith("No tasks scheduled.")
+    assert "Groom" in schedule.explanation
+
+    # Act: Explicit text and reset
+    schedule.explanation = "custom"
+    assert schedule.explanation == "custom"
+    schedule.explanation = None
+    assert "Groom" in schedule.explanation
+
+
+def test_time_minutes_tracks_preferred_time():
+    """
+    Cached Time Test: time_minutes is parsed once from preferred_time and
+    re-parsed whenever preferred_time changes.
+    """
+    task = CareTask(name="Walk", duration=30, priority="high", preferred_time="2:30 PM")
+    assert task.time_minutes == 870
+
+    # Act: Change the time via update_task
+    task.update_task(preferred_time="08:00")
+    assert task.time_minutes == 480
+    task.update_task(preferred_time=None)
+
+    # Assert: Untimed tasks sort to end of day
+    assert task.time_minutes == 1440
+
+
+def test_derived_end_and_priority_fields():
+    """
+    Cached Fields Test: end_minutes follows preferred_time and duration, and
+    priority_value follows priority (including lowercase normalization).
+    """
+    task = CareTask(name="Walk", duration=30, priority="HIGH", preferred_time="10:00")
+    assert task.end_minutes == 630
+    assert task.priority_value == 3
+
+    task.update_task(duration=45, priority="low")
+    assert task.end_minutes == 645
+    assert task.priority_value == 1
+
+    task.update_task(preferred_time="10:30")
+    assert task.end_minutes == 675
+
+
+def test_task_equality_by_id():
+    """
+    Task Identity Test: tasks compare and hash by task_id, so an edited task
+    still matches itself and two look-alike tasks stay distinct.
+    """
+    walk = CareTask(name="Walk", duration=30, priority="high")
+    twin = CareTask(name="Walk", duration=30, priority="high")
+    assert walk != twin
+    assert len({walk, twin}) == 2
+
+    seen = {walk}
+    walk.update_task(duration=45)
+    assert walk in seen
+    assert walk == CareTask(name="Other", duration=5, priority="low", task_id=walk.task_id)
+
+
+def test_update_only_touches_fields():
+    """
+    Update Test: update_task/update_info assign constructor fields and skip
+    unknown keys and derived fields.
+    """
+    task = CareTask(name="Walk", duration=30, priority="high", preferred_time="08:00")
+    task.update_task(notes="leash", time_minutes=0, bogus=1)
+    assert task.notes == "leash"
+    assert task.time_minutes == 480
+
+    pet = Pet(name="Buddy", type="dog")
+    pet.update_info(age=3, get_info="nope")
+    assert pet.age == 3
+    assert pet.get_info() == "Buddy (dog), Age: 3"
+
+
+def test_update_task_keeps_task_id():
+    """
+    Identity Test: update_task ignores task_id, so a task stays findable in
+    its pet and in sets after an update.
+    """
+    pet = Pet(name="Buddy", type="dog")
+    task = CareTask(name="Walk", duration=30, priority="high")
+    original_id = task.task_id
+    pet.add_task(task)
+    seen = {task}
+
+    # Act: Try to reassign the ID alongside a normal edit
+    task.update_task(task_id="x", notes="leash")
+
+    # Assert: ID is unchanged and lookups still work
+    assert task.task_id == original_id
+    assert task.notes == "leash"
+    assert task in pet
+    assert task in seen
+
+
 if __name__ == "__main__":
     # Run all tests
     tests = [
         # Basic functionality
         ("Task Completion", test_task_completion),
         ("Task Addition to Pet", test_task_addition_to_pet),
+        ("Pet Task Lookup by ID", test_pet_task_lookup_by_id),
 
         # Recurring tasks
         ("Recurring Task - Daily", test_recurring_task_daily),
         ("Recurring Task - Weekly", test_recurring_task_weekly),
         ("Recurring Task - Once", test_recurring_task_once),
         ("Recurring - No Due Date", test_recurring_daily_without_due_date),
+        ("Recurring - Supplied Today", test_recurring_uses_supplied_today),
         ("Recurring - Chain", test_recurring_task_chain),
+        ("Recurring - Expand", test_recurring_expand_matches_chain),
         ("Recurring - Preserve Attributes", test_recurring_task_preserves_attributes),
 
         # Conflict detection
@@ -663,6 +1126,9 @@ if __name__ == "__main__":
         ("Conflict - Multiple Collisions", test_conflict_detection_multiple_collisions),
         ("Conflict - Back-to-Back", test_conflict_detection_back_to_back),
         ("Conflict - 1 Min Overlap", test_conflict_detection_one_minute_overlap),
+        ("Conflict - Long Task Spans Many", test_conflict_detection_long_task_spans_many),
+        ("Conflict - Stored on Schedule", test_schedule_exposes_conflicts),
+        ("Edge - Lazy Explanation", test_schedule_explanation_built_on_read),
 
         # Sorting
         ("Sort - Chronological Order", test_sort_by_time_chronological_order),
@@ -670,18 +1136,33 @@ if __name__ == "__main__":
 
         # Edge cases
         ("Edge - No Tasks", test_pet_with_no_tasks),
+        ("Edge - Add/Remove Totals", test_schedule_add_remove_tracks_total_duration),
+        ("Sort - Schedule Time View", test_schedule_tasks_by_time_stays_sorted),
+        ("Sort - Priority Cache", test_sort_by_priority_cache_tracks_edits),
+        ("Schedule - Result Cache", test_generate_schedule_reuses_results_until_edit),
         ("Edge - Zero Time", test_zero_time_available),
         ("Edge - Exact Fit", test_single_task_exactly_fits_time),
 
         # Priority scheduling
         ("Priority - High Before Low", test_high_priority_scheduled_before_low),
         ("Priority - Same Priority Order", test_same_priority_shorter_task_first),
+        ("Priority - Fill Leftover Time", test_lower_priority_fills_leftover_time),
+        ("Priority - Avoid Overlaps", test_avoid_overlaps_keeps_more_compatible_tasks),
+        ("Priority - Overlap-Free Budget", test_avoid_overlaps_spends_budget_by_priority),
 
         # AM/PM time format support
         ("AM/PM - Time Parsing", test_am_pm_time_parsing),
         ("AM/PM - Sorting", test_am_pm_sorting),
         ("AM/PM - Conflict Detection", test_am_pm_conflict_detection),
         ("AM/PM - Exact Time Conflict", test_am_pm_exact_time_conflict),
+
+        # Sorting helpers
+        ("Sort - Standalone Helper", test_sort_tasks_by_time_matches_scheduler),
+        ("Sort - Cached Time Minutes", test_time_minutes_tracks_preferred_time),
+        ("Sort - Cached End/Priority", test_derived_end_and_priority_fields),
+        ("Task - Equality by ID", test_task_equality_by_id),
+        ("Task - Update Fields Only", test_update_only_touches_fields),
+        ("Task - Update Keeps ID", test_update_task_keeps_task_id),
     ]
 
     passed = 0